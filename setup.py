@@ -10,7 +10,7 @@ setup(
     install_requires=[
         "pillow",
         "pyperclip",
-        "imagekitio",
+        "aiohttp",
         "cryptography",
         "pystray",
         "python-dotenv",
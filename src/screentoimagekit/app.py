@@ -28,17 +28,19 @@ class ScreenToImageKit:
         imagekit_private_key = self.config_manager.get('PRIVATE_KEY')
         imagekit_public_key = self.config_manager.get('PUBLIC_KEY')
         imagekit_url_endpoint = self.config_manager.get('URL_ENDPOINT')
+        compress_uploads = self.config_manager.get('COMPRESS_UPLOADS', 'false').lower() in ('1', 'true', 'yes')
         
         # Initialize services with config
         self.image_handler = ImageHandler(self.temp_file_service, gemini_api_key)
         self.imagekit_service = ImageKitService(
             private_key=imagekit_private_key,
             public_key=imagekit_public_key,
-            url_endpoint=imagekit_url_endpoint
+            url_endpoint=imagekit_url_endpoint,
+            compress_uploads=compress_uploads
         )
         
-        # Clean up any leftover temporary files
-        self.temp_file_service.cleanup_temp_files()
+        # Clean up any leftover temporary files, including earlier sessions'
+        self.temp_file_service.cleanup_temp_files(force=True)
         
         # Create main window
         self.root = tk.Tk()
@@ -88,7 +90,8 @@ class ScreenToImageKit:
             logger.error(f"Error in main loop: {e}")
         finally:
             # Clean up temporary files on exit
-            self.temp_file_service.cleanup_temp_files()
+            self.temp_file_service.cleanup_temp_files(force=True)
+            self.imagekit_service.close()
             logger.info("Application shutdown complete")
 
     def exit(self):
@@ -105,7 +108,7 @@ class ScreenToImageKit:
         """Clean up application resources."""
         try:
             # Clean up temporary files
-            self.temp_file_service.cleanup_temp_files()
+            self.temp_file_service.cleanup_temp_files(force=True)
             
             # Stop system tray
             if self.system_tray:
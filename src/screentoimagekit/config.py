@@ -42,6 +42,8 @@ class ConfigManager:
     def __init__(self):
         """Initialize the configuration manager."""
         self.env_loaded = False
+        # (file stats, credentials) of the last successful load_credentials
+        self._credentials_cache = None
         self.load_env()
     
     def load_env(self):
@@ -119,6 +121,7 @@ class ConfigManager:
             encrypted_credentials = encrypt_credentials(private_key, public_key, url_endpoint, key)
             with open(CREDENTIALS_FILE, 'wb') as f:
                 f.write(encrypted_credentials)
+            self._credentials_cache = None
                 
             logger.info("Credentials saved successfully")
             return True
@@ -128,13 +131,24 @@ class ConfigManager:
             return False
     
     def load_credentials(self):
-        """Load ImageKit credentials from encrypted file."""
+        """Load ImageKit credentials from encrypted file.
+
+        The decrypted credentials are reused until either file changes.
+        """
         try:
             # Check if files exist
-            if not os.path.exists(CREDENTIALS_FILE) or not os.path.exists(KEY_FILE):
+            try:
+                creds_stat = os.stat(CREDENTIALS_FILE)
+                key_stat = os.stat(KEY_FILE)
+            except FileNotFoundError:
                 logger.warning("Credentials or key file not found")
                 return None, None, None
             
+            file_stats = (creds_stat.st_mtime_ns, creds_stat.st_size,
+                          key_stat.st_mtime_ns, key_stat.st_size)
+            if self._credentials_cache and self._credentials_cache[0] == file_stats:
+                return self._credentials_cache[1]
+            
             # Load key and encrypted credentials
             with open(KEY_FILE, 'rb') as f:
                 key = f.read()
@@ -142,9 +156,10 @@ class ConfigManager:
                 encrypted_credentials = f.read()
             
             # Decrypt credentials
-            private_key, public_key, url_endpoint = decrypt_credentials(encrypted_credentials, key)
+            credentials = decrypt_credentials(encrypted_credentials, key)
+            self._credentials_cache = (file_stats, credentials)
             logger.info("Credentials loaded successfully")
-            return private_key, public_key, url_endpoint
+            return credentials
             
         except Exception as e:
             logger.error(f"Error loading credentials: {e}")
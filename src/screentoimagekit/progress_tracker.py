@@ -15,6 +15,15 @@ class WorkflowStage(Enum):
     UPLOAD = auto()
     CLIPBOARD = auto()
 
+# Status message shown when each stage starts
+_STAGE_MESSAGES = {
+    WorkflowStage.CAPTURE: "Capturing screenshot...",
+    WorkflowStage.ANALYSIS: "Analyzing image content with Gemini AI...",
+    WorkflowStage.RENAME: "Renaming file based on AI description...",
+    WorkflowStage.UPLOAD: "Uploading image to ImageKit...",
+    WorkflowStage.CLIPBOARD: "Copying URL to clipboard..."
+}
+
 class ProgressTracker:
     """Tracks and reports progress through the screenshot workflow."""
     
@@ -44,15 +53,7 @@ class ProgressTracker:
         """Start tracking a new workflow stage."""
         self.current_stage = stage
         self.start_time = time.time()
-        
-        messages = {
-            WorkflowStage.CAPTURE: "Capturing screenshot...",
-            WorkflowStage.ANALYSIS: "Analyzing image content with Gemini AI...",
-            WorkflowStage.RENAME: "Renaming file based on AI description...",
-            WorkflowStage.UPLOAD: "Uploading image to ImageKit...",
-            WorkflowStage.CLIPBOARD: "Copying URL to clipboard..."
-        }
-        self.status_callback(messages[stage], False)
+        self.status_callback(_STAGE_MESSAGES[stage], False)
         logger.info(f"Starting stage: {stage.name}")
     
     def update_progress(self, message: str, is_error: bool = False):
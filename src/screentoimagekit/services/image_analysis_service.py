@@ -9,28 +9,43 @@ import threading
 import base64
 from typing import Optional, Dict, Any
 import time
-import re
 from datetime import datetime
+from ..utils.sanitize import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
-def _encode_image(image_path: str) -> Optional[Dict[str, str]]:
+_PADDING_WORDS = ("screenshot", "image", "capture")
+
+# Read size for streaming base64 encoding; a multiple of 3 keeps padding
+# out of chunk boundaries so encoded chunks can be concatenated directly.
+_ENCODE_CHUNK_SIZE = 48 * 1024
+
+def _encode_image(image_path: str, mime_type: str = 'image/jpeg') -> Optional[Dict[str, str]]:
     """Convert image to base64 encoding.
 
+    The file is streamed in chunks into a pre-sized output buffer so the raw
+    image bytes are never held in memory alongside the encoded copy.
+
     Args:
         image_path (str): Path to the image file
+        mime_type (str): MIME type to report for the image data
 
     Returns:
         Optional[Dict[str, str]]: Image data in Gemini-compatible format or None if error
     """
     try:
+        file_size = os.path.getsize(image_path)
+        encoded = bytearray(((file_size + 2) // 3) * 4)
+        offset = 0
         with open(image_path, 'rb') as image_file:
-            image_data = image_file.read()
-            base64_data = base64.b64encode(image_data).decode('utf-8')
-            return {
-                'mime_type': 'image/jpeg',
-                'data': base64_data
-            }
+            for chunk in iter(lambda: image_file.read(_ENCODE_CHUNK_SIZE), b''):
+                encoded_chunk = base64.b64encode(chunk)
+                encoded[offset:offset + len(encoded_chunk)] = encoded_chunk
+                offset += len(encoded_chunk)
+        return {
+            'mime_type': mime_type,
+            'data': str(memoryview(encoded)[:offset], 'ascii')
+        }
     except Exception as e:
         logger.error(f"Error encoding image: {str(e)}")
         return None
@@ -45,10 +60,15 @@ class ImageAnalysisService:
         self.timeout = 10  # Maximum wait time in seconds
         self.min_wait = 1  # Minimum wait time in seconds
         self._lock = threading.Lock()
+        # Shared, capped pool so concurrent analyses queue up instead of
+        # firing enough parallel requests to trip Gemini's rate limits
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
 
         if self.api_key:
             try:
-                genai.configure(api_key=self.api_key)
+                # Pin the gRPC transport so every request reuses one
+                # persistent HTTP/2 channel instead of new TLS handshakes
+                genai.configure(api_key=self.api_key, transport="grpc")
 
                 generation_config = {
                     "temperature": 1,
@@ -88,11 +108,9 @@ class ImageAnalysisService:
             - Only valid filename characters
         """
         try:
-            # Clean the description: lowercase and replace invalid chars
-            clean_desc = re.sub(r'[^a-zA-Z0-9_]', '_', description.lower())
-            
-            # Remove consecutive underscores
-            clean_desc = re.sub(r'_+', '_', clean_desc)
+            # Clean the description: lowercase, replace invalid chars and
+            # collapse consecutive underscores
+            clean_desc = sanitize_filename(description)
             
             # Get current time in HHMM format
             current_time = datetime.now().strftime("%H%M")
@@ -104,10 +122,16 @@ class ImageAnalysisService:
             
             # Adjust description length
             if len(clean_desc) < target_min:
-                # Pad with meaningful words if too short
-                padding_words = ["screenshot", "image", "capture"]
-                while len(clean_desc) < target_min and padding_words:
-                    clean_desc = f"{clean_desc}_{padding_words.pop(0)}"
+                # Pad with meaningful words if too short, tracking the
+                # joined length arithmetically and joining once at the end
+                parts = [clean_desc]
+                length = len(clean_desc)
+                for word in _PADDING_WORDS:
+                    if length >= target_min:
+                        break
+                    parts.append(word)
+                    length += len(word) + 1
+                clean_desc = '_'.join(parts)
             elif len(clean_desc) > target_max:
                 # Truncate if too long, but keep whole words
                 clean_desc = clean_desc[:target_max]
@@ -142,9 +166,7 @@ class ImageAnalysisService:
             str: Processed description
         """
         # Clean up the description
-        description = raw_description.lower()
-        # Remove any special characters and spaces
-        description = "".join(c for c in description if c.isalnum() or c == '_')
+        description = sanitize_filename(raw_description)
         # Ensure it's not too long
         words = description.split('_')
         if len(words) > max_words:
@@ -154,30 +176,26 @@ class ImageAnalysisService:
     async def _analyze_with_timeout(self, image_data: Dict[str, str], prompt: str) -> Optional[Any]:
         """Analyze image with timeout using asyncio."""
         try:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                start_time = time.time()
-
-                with self._lock:
-                    future = executor.submit(
-                        self.model.generate_content,
-                        [image_data, prompt]
-                    )
-
-                await asyncio.sleep(self.min_wait)
-
-                elapsed = time.time() - start_time
-                remaining = max(0, self.timeout - elapsed)
-
-                try:
-                    response = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: future.result(timeout=remaining)
-                    )
-                    logger.info(f"Gemini API response received in {elapsed:.2f} seconds")
-                    return response
-                except concurrent.futures.TimeoutError:
-                    logger.warning(f"Gemini API timeout after {self.timeout} seconds")
-                    return None
+            start_time = time.time()
+
+            with self._lock:
+                future = self._executor.submit(
+                    self.model.generate_content,
+                    [image_data, prompt]
+                )
+
+            await asyncio.sleep(self.min_wait)
+
+            elapsed = time.time() - start_time
+            remaining = max(0, self.timeout - elapsed)
+
+            try:
+                response = await asyncio.wait_for(asyncio.wrap_future(future), timeout=remaining)
+                logger.info(f"Gemini API response received in {time.time() - start_time:.2f} seconds")
+                return response
+            except asyncio.TimeoutError:
+                logger.warning(f"Gemini API timeout after {self.timeout} seconds")
+                return None
 
         except Exception as e:
             self._log_error("Error in _analyze_with_timeout", e)
@@ -233,11 +251,10 @@ class ImageAnalysisService:
             return None
 
         try:
-            with open(image_path, 'rb') as image_file:
-                image_data = {
-                    'mime_type': 'image/png',
-                    'data': base64.b64encode(image_file.read()).decode('utf-8')
-                }
+            image_data = _encode_image(image_path, 'image/png')
+            if not image_data:
+                logger.error("Failed to encode image")
+                return None
 
             prompt = """
             Analyze this screenshot and provide a very concise name (3-4 words maximum) that describes its content.
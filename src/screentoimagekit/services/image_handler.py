@@ -1,12 +1,15 @@
 """Image handling service for capturing and processing screenshots."""
 
+import io
 import os
 import logging
+import time
 from PIL import Image, ImageGrab
 from datetime import datetime
 import google.generativeai as genai
 from pathlib import Path
 from .temp_file_service import TempFileService
+from ..utils.sanitize import sanitize_filename
 
 logger = logging.getLogger(__name__)
 
@@ -26,20 +29,24 @@ class ImageHandler:
         self.gemini_model = None
         if gemini_api_key:
             try:
-                genai.configure(api_key=gemini_api_key)
-                self.gemini_model = genai.GenerativeModel('gemini-1.5-pro-vision')
+                # Pin the gRPC transport so every request reuses one
+                # persistent HTTP/2 channel instead of new TLS handshakes
+                genai.configure(api_key=gemini_api_key, transport="grpc")
+                self.gemini_model = genai.GenerativeModel('gemini-1.5-flash')
                 logger.info("Gemini model initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Gemini model: {e}")
 
-    def capture_area(self, coords):
+    def capture_area(self, coords, save=True):
         """Capture a screenshot of the specified area.
         
         Args:
             coords: A tuple of (left, top, right, bottom) coordinates
+            save: Whether to write the screenshot to a temporary file
             
         Returns:
-            tuple: (temp_file_path, screenshot_image)
+            tuple: (temp_file_path, screenshot_image); the path is None
+                when save is False
         """
         try:
             # Ensure coordinates are integers
@@ -48,6 +55,8 @@ class ImageHandler:
             
             # Capture the screenshot
             screenshot = ImageGrab.grab(bbox=coords)
+            if not save:
+                return None, screenshot
             
             # Save to temporary file
             temp_path = self.temp_file_service.generate_temp_path()
@@ -60,15 +69,21 @@ class ImageHandler:
             logger.error(f"Error capturing screenshot: {e}")
             raise
 
-    def capture_fullscreen(self):
+    def capture_fullscreen(self, save=True):
         """Capture a full screen screenshot.
         
+        Args:
+            save: Whether to write the screenshot to a temporary file
+            
         Returns:
-            tuple: (temp_file_path, screenshot_image)
+            tuple: (temp_file_path, screenshot_image); the path is None
+                when save is False
         """
         try:
             # Capture the screenshot
             screenshot = ImageGrab.grab()
+            if not save:
+                return None, screenshot
             
             # Save to temporary file
             temp_path = self.temp_file_service.generate_temp_path()
@@ -81,6 +96,20 @@ class ImageHandler:
             logger.error(f"Error capturing full screen: {e}")
             raise
 
+    def encode_png(self, image):
+        """Encode an image as PNG in memory for uploading.
+        
+        Args:
+            image: PIL Image object
+            
+        Returns:
+            tuple: (file_name, png_data)
+        """
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        file_name = f"screenshot_{int(time.time() * 1000)}.png"
+        return file_name, buffer.getbuffer()
+
     def get_image_description(self, image_path):
         """Get a description of the image using Gemini Vision.
         
@@ -95,28 +124,27 @@ class ImageHandler:
                 logger.warning("Gemini model not initialized - no API key provided")
                 return None
 
-            # Load and prepare the image
-            with Image.open(image_path) as image:
-                # Convert to RGB if needed
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                # Generate description
-                response = self.gemini_model.generate_content(
-                    ["Describe this screenshot in a few words that would make a good filename", image],
-                    generation_config={
-                        'temperature': 0.1,  # More focused output
-                        'max_output_tokens': 50  # Short description
-                    }
-                )
+            # Hand Gemini the encoded PNG bytes directly; decoding to RGB
+            # here would only be re-encoded by the SDK before sending
+            with open(image_path, 'rb') as image_file:
+                image_data = {'mime_type': 'image/png', 'data': image_file.read()}
+            
+            # Generate description
+            response = self.gemini_model.generate_content(
+                ["Describe this screenshot in a few words that would make a good filename", image_data],
+                generation_config={
+                    'temperature': 0.1,  # More focused output
+                    'max_output_tokens': 50  # Short description
+                }
+            )
+            
+            if not response.text:
+                logger.warning("Gemini returned empty response")
+                return None
                 
-                if not response.text:
-                    logger.warning("Gemini returned empty response")
-                    return None
-                    
-                description = response.text.strip()
-                logger.info(f"Generated description: {description}")
-                return description
+            description = response.text.strip()
+            logger.info(f"Generated description: {description}")
+            return description
             
         except Exception as e:
             logger.error(f"Error getting image description: {e}")
@@ -137,8 +165,7 @@ class ImageHandler:
                 return temp_path
                 
             # Clean up description for filename
-            clean_desc = "".join(c if c.isalnum() or c in " -_" else "_" for c in description)
-            clean_desc = clean_desc.strip().replace(" ", "_")[:50]  # Limit length
+            clean_desc = sanitize_filename(description, max_len=50)
             
             # Create new filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -148,6 +175,7 @@ class ImageHandler:
             
             # Rename file
             os.rename(temp_path, new_path)
+            self.temp_file_service.record_rename(temp_path, new_path)
             logger.info(f"Renamed {temp_path} to {new_path}")
             
             return new_path
@@ -187,9 +215,4 @@ class ImageHandler:
         Args:
             temp_path: Path to the temporary file
         """
-        try:
-            if temp_path and os.path.exists(temp_path):
-                os.remove(temp_path)
-                logger.debug(f"Cleaned up temporary file: {temp_path}")
-        except Exception as e:
-            logger.error(f"Error cleaning up temporary file: {e}")
+        self.temp_file_service.cleanup_file(temp_path)
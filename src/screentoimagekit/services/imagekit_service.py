@@ -1,106 +1,325 @@
 """ImageKit service integration for ScreenToImageKit."""
 
+import asyncio
+import io
 import logging
-import pyperclip
+import mimetypes
 import os
+import random
+import threading
 import time
-from imagekitio import ImageKit
-from imagekitio.models.UploadFileRequestOptions import UploadFileRequestOptions
+from email.utils import parsedate_to_datetime
+import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# ImageKit upload API endpoint
+UPLOAD_URL = "https://upload.imagekit.io/api/v1/files/upload"
+
+# Total time allowed for a single upload request, in seconds
+UPLOAD_TIMEOUT = 60
+
+# How long idle upload connections stay open for reuse, in seconds.
+# Screenshots are often minutes apart, well past aiohttp's 15 s default.
+KEEPALIVE_TIMEOUT = 120
+
+# How long resolved upload host addresses are cached, in seconds
+DNS_CACHE_TTL = 600
+
+# WebP quality used when compressing uploads
+WEBP_QUALITY = 85
+
+# Default number of uploads allowed in flight at once; override with the
+# SCREENTOIMAGEKIT_MAX_CONCURRENT environment variable
+DEFAULT_MAX_CONCURRENT_UPLOADS = 6
+
+def _copy_to_clipboard(url):
+    """Copy a URL to the clipboard, logging rather than raising on failure."""
+    try:
+        import pyperclip
+        pyperclip.copy(url)
+    except Exception as e:
+        logger.error(f"Error copying URL to clipboard: {e}")
+
+def _compress_to_webp(data, file_name):
+    """Re-encode image bytes as WebP.
+
+    Args:
+        data: Encoded image contents, e.g. PNG bytes
+        file_name: Original file name
+
+    Returns:
+        tuple: (webp_data, file_name with a .webp extension)
+    """
+    from PIL import Image
+    buffer = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return buffer.getbuffer(), f"{os.path.splitext(file_name)[0]}.webp"
+
+def _read_file(file_path):
+    """Read a file's full contents as bytes."""
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+# HTTP status codes worth retrying; any other error response is final
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
 class ImageKitService:
     """Handles ImageKit integration and file uploads."""
 
-    def __init__(self, private_key=None, public_key=None, url_endpoint=None):
-        """Initialize ImageKit service with credentials."""
-        self.imagekit = None
+    # Upload options shared by every upload, as multipart form fields
+    _UPLOAD_OPTIONS = (
+        ('folder', '/screenshots'),
+        ('tags', 'screenshot'),
+        ('responseFields', 'isPrivateFile,tags'),
+    )
+
+    def __init__(self, private_key=None, public_key=None, url_endpoint=None,
+                 base_delay=0.25, max_delay=30.0, compress_uploads=False):
+        """Initialize ImageKit service with credentials.
+
+        Args:
+            private_key: ImageKit private API key
+            public_key: ImageKit public API key
+            url_endpoint: ImageKit URL endpoint
+            base_delay: Initial retry backoff in seconds
+            max_delay: Upper bound on a single retry backoff in seconds
+            compress_uploads: Re-encode images as WebP before uploading
+        """
+        self._credentials = None  # (private_key, public_key, url_endpoint)
+        self.compress_uploads = compress_uploads
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._auth_headers = None
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._session = None
+        self._queue = None
+        self._workers = []
+        self.max_concurrent_uploads = max(1, int(os.getenv(
+            "SCREENTOIMAGEKIT_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT_UPLOADS
+        )))
         if all([private_key, public_key, url_endpoint]):
             self.initialize(private_key, public_key, url_endpoint)
 
     def initialize(self, private_key, public_key, url_endpoint):
-        """Initialize or reinitialize ImageKit client."""
+        """Initialize or reinitialize the ImageKit credentials used for uploads."""
         try:
-            self.imagekit = ImageKit(
-                private_key=private_key,
-                public_key=public_key,
-                url_endpoint=url_endpoint
-            )
+            if not all([private_key, public_key, url_endpoint]):
+                raise ValueError("private key, public key and URL endpoint are all required")
+            self._credentials = (private_key, public_key, url_endpoint)
+            # Build the Basic auth header once rather than on every request
+            self._auth_headers = {
+                'Authorization': aiohttp.BasicAuth(private_key, '').encode()
+            }
             return True
         except Exception as e:
             logger.error(f"Error initializing ImageKit: {e}")
-            self.imagekit = None
+            self._credentials = None
+            self._auth_headers = None
             return False
 
-    def upload_file(self, file_path, max_retries=3, retry_delay=1):
+    def _get_loop(self):
+        """Return the background upload event loop, starting it on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="imagekit-upload-loop",
+                    daemon=True
+                ).start()
+                asyncio.run_coroutine_threadsafe(self._start_upload_workers(), self._loop).result()
+                logger.debug("Started background upload event loop")
+            return self._loop
+
+    async def _start_upload_workers(self):
+        """Create the upload queue and the worker tasks that drain it."""
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.ensure_future(self._upload_worker())
+            for _ in range(self.max_concurrent_uploads)
+        ]
+
+    async def _upload_worker(self):
+        """Upload queued jobs one at a time until cancelled."""
+        while True:
+            upload, args, callback = await self._queue.get()
+            url, error = None, None
+            try:
+                url = await upload(*args)
+            except Exception as e:
+                error = e
+            finally:
+                self._queue.task_done()
+            if callback:
+                try:
+                    callback(url, error)
+                except Exception as e:
+                    logger.error(f"Error in upload callback: {e}")
+
+    def _get_session(self):
+        """Return the shared HTTP session, creating it lazily in the upload loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrent_uploads,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TTL
+                ),
+                timeout=aiohttp.ClientTimeout(total=UPLOAD_TIMEOUT)
+            )
+        return self._session
+
+    @staticmethod
+    def _is_transient(error):
+        """Check whether a failed upload attempt is worth retrying.
+
+        Args:
+            error: Exception raised by the upload attempt
+
+        Returns:
+            bool: True for connection errors, timeouts and retryable HTTP
+                statuses, False for everything else (auth, validation, ...)
+        """
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in TRANSIENT_STATUS_CODES
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionError))
+
+    def _backoff_delay(self, attempt, error):
+        """Compute how long to wait before the next upload attempt.
+
+        Uses capped exponential backoff with jitter, unless the server sent a
+        Retry-After header with the failed response.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            error: Exception raised by that attempt
+
+        Returns:
+            float: Delay in seconds
+        """
+        headers = getattr(error, 'headers', None)
+        retry_after = headers.get('Retry-After') if headers else None
+        if retry_after:
+            try:
+                return min(self._max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after).timestamp()
+                    return min(self._max_delay, max(0.0, retry_at - time.time()))
+                except (TypeError, ValueError):
+                    pass
+        delay = min(self._max_delay, self._base_delay * (2 ** attempt))
+        return delay * (0.5 + random.random() * 0.5)
+
+    async def upload_file_async(self, file_path, max_retries=3, copy_to_clipboard=True):
         """Upload file to ImageKit with retries.
-        
+
+        Must be awaited on the service's upload loop (see upload_file) so the
+        shared HTTP session and its keep-alive connections are reused.
+
         Args:
             file_path: Path to the file to upload
             max_retries: Maximum number of upload attempts
-            retry_delay: Delay between retries in seconds
+            copy_to_clipboard: Copy the URL to the clipboard in the background
+
+        Returns:
+            str: URL of the uploaded file
         """
-        if not self.imagekit:
+        if not self.is_configured:
             error_msg = "ImageKit not initialized - check your API credentials"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        if not os.path.exists(file_path):
+        # Read the file once up front; every retry resends the same bytes
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(None, _read_file, file_path)
+        except FileNotFoundError:
             error_msg = f"File not found: {file_path}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
 
+        return await self.upload_bytes_async(
+            data, os.path.basename(file_path), max_retries, copy_to_clipboard
+        )
+
+    async def upload_bytes_async(self, data, file_name, max_retries=3, copy_to_clipboard=True):
+        """Upload in-memory file contents to ImageKit with retries.
+
+        Must be awaited on the service's upload loop (see upload_bytes).
+
+        Args:
+            data: Encoded file contents, e.g. PNG bytes
+            file_name: Name to upload the file as
+            max_retries: Maximum number of upload attempts
+            copy_to_clipboard: Copy the URL to the clipboard in the background
+
+        Returns:
+            str: URL of the uploaded file
+        """
+        if not self.is_configured:
+            error_msg = "ImageKit not initialized - check your API credentials"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+
+        if self.compress_uploads:
+            try:
+                data, file_name = await asyncio.get_running_loop().run_in_executor(
+                    None, _compress_to_webp, data, file_name
+                )
+            except Exception as e:
+                logger.error(f"Error compressing image to WebP, uploading original: {e}")
+
+        content_type = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+        session = self._get_session()
+        headers = self._auth_headers
+
         last_error = None
         for attempt in range(max_retries):
             try:
-                logger.debug(f"Upload attempt {attempt + 1}/{max_retries} for file: {file_path}")
-                
-                if not os.path.exists(file_path):
-                    raise FileNotFoundError(f"File disappeared during upload attempt: {file_path}")
-
-                options = UploadFileRequestOptions(
-                    response_fields=["is_private_file", "tags"],
-                    tags=["screenshot"],
-                    folder="/screenshots"
-                )
+                logger.debug(f"Upload attempt {attempt + 1}/{max_retries} for file: {file_name}")
+
+                form = aiohttp.FormData()
+                form.add_field('file', data, filename=file_name, content_type=content_type)
+                form.add_field('fileName', file_name)
+                for name, value in self._UPLOAD_OPTIONS:
+                    form.add_field(name, value)
 
-                with open(file_path, 'rb') as file:
-                    file_name = os.path.basename(file_path)
-                    logger.debug(f"Uploading file with name: {file_name}")
-                    
-                    try:
-                        upload = self.imagekit.upload_file(
-                            file=file,
-                            file_name=file_name,
-                            options=options
+                async with session.post(UPLOAD_URL, data=form, headers=headers) as response:
+                    if response.status >= 400:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            message=await response.text(),
+                            headers=response.headers
                         )
-                        
-                        if upload and hasattr(upload, 'url'):
-                            logger.info(f"Upload successful on attempt {attempt + 1}. URL: {upload.url}")
-                            pyperclip.copy(upload.url)
-                            return upload.url
-                        else:
-                            raise Exception(f"Invalid response from ImageKit: {upload}")
-                            
-                    except Exception as e:
-                        logger.error(f"ImageKit API error on attempt {attempt + 1}: {str(e)}")
-                        if hasattr(e, '__traceback__'):
-                            import traceback
-                            logger.error(f"Stack trace:\n{''.join(traceback.format_tb(e.__traceback__))}")
-                        last_error = e
-                        raise
+                    upload = await response.json()
+
+                url = upload.get('url') if isinstance(upload, dict) else None
+                if url:
+                    logger.info(f"Upload successful on attempt {attempt + 1}. URL: {url}")
+                    if copy_to_clipboard:
+                        asyncio.get_running_loop().run_in_executor(None, _copy_to_clipboard, url)
+                    return url
+                raise Exception(f"Invalid response from ImageKit: {upload}")
 
             except Exception as e:
                 last_error = e
-                error_msg = f"Upload attempt {attempt + 1} failed: {str(e)}"
-                if hasattr(e, '__traceback__'):
-                    import traceback
-                    error_msg += f"\nStack trace:\n{''.join(traceback.format_tb(e.__traceback__))}"
-                logger.error(error_msg)
-                
+                logger.error(f"Upload attempt {attempt + 1} failed: {str(e)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Stack trace:", exc_info=e)
+
+                if not self._is_transient(e):
+                    logger.error("Upload error is not transient, giving up")
+                    raise
+
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    retry_delay = self._backoff_delay(attempt, e)
+                    logger.info(f"Retrying in {retry_delay:.2f} seconds...")
+                    await asyncio.sleep(retry_delay)
                 continue
 
         # If we get here, all retries failed
@@ -110,7 +329,147 @@ class ImageKitService:
         logger.error(final_error)
         raise Exception(final_error)
 
+    def upload_file(self, file_path, max_retries=3):
+        """Upload file to ImageKit with retries, blocking until it finishes.
+
+        The upload itself runs on the service's background event loop.
+
+        Args:
+            file_path: Path to the file to upload
+            max_retries: Maximum number of upload attempts
+
+        Returns:
+            str: URL of the uploaded file
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.upload_file_async(file_path, max_retries),
+            self._get_loop()
+        )
+        return future.result()
+
+    def upload_bytes(self, data, file_name, max_retries=3):
+        """Upload in-memory file contents to ImageKit, blocking until it finishes.
+
+        Lets callers upload a freshly encoded screenshot without writing it
+        to a temporary file first.
+
+        Args:
+            data: Encoded file contents, e.g. PNG bytes
+            file_name: Name to upload the file as
+            max_retries: Maximum number of upload attempts
+
+        Returns:
+            str: URL of the uploaded file
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.upload_bytes_async(data, file_name, max_retries),
+            self._get_loop()
+        )
+        return future.result()
+
+    def enqueue_upload(self, data, file_name, callback=None):
+        """Queue in-memory file contents for upload and return immediately.
+
+        Queued uploads are drained by max_concurrent_uploads workers on the
+        background upload loop.
+
+        Args:
+            data: Encoded file contents, e.g. PNG bytes
+            file_name: Name to upload the file as
+            callback: Optional callable taking (url, error), called on the
+                upload loop thread when the upload finishes; error is None
+                on success and url is None on failure
+        """
+        self._enqueue(self.upload_bytes_async, (data, file_name), callback)
+
+    def enqueue_file_upload(self, file_path, callback=None):
+        """Queue a file for upload and return immediately.
+
+        Args:
+            file_path: Path to the file to upload; it must exist until the
+                callback runs
+            callback: Optional callable taking (url, error), called on the
+                upload loop thread when the upload finishes
+        """
+        self._enqueue(self.upload_file_async, (file_path,), callback)
+
+    def _enqueue(self, upload, args, callback):
+        """Hand an upload coroutine function and its arguments to the workers."""
+        loop = self._get_loop()
+        loop.call_soon_threadsafe(self._queue.put_nowait, (upload, args, callback))
+
+    async def upload_files_async(self, file_paths, max_retries=3):
+        """Upload several files to ImageKit concurrently.
+
+        At most max_concurrent_uploads uploads are in flight at once; all of
+        them share the same HTTP session and connection pool.
+
+        Args:
+            file_paths: Paths of the files to upload
+            max_retries: Maximum number of upload attempts per file
+
+        Returns:
+            list: For each path, in order, the uploaded URL or the exception
+                that made its upload fail
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
+
+        async def _upload(file_path):
+            async with semaphore:
+                return await self.upload_file_async(file_path, max_retries, copy_to_clipboard=False)
+
+        results = await asyncio.gather(
+            *(_upload(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+
+        # Copy only the last successful URL rather than one per file
+        urls = [result for result in results if isinstance(result, str)]
+        if urls:
+            asyncio.get_running_loop().run_in_executor(None, _copy_to_clipboard, urls[-1])
+        return results
+
+    def upload_files(self, file_paths, max_retries=3):
+        """Upload several files to ImageKit concurrently, blocking until all finish.
+
+        Args:
+            file_paths: Paths of the files to upload
+            max_retries: Maximum number of upload attempts per file
+
+        Returns:
+            list: For each path, in order, the uploaded URL or the exception
+                that made its upload fail
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.upload_files_async(file_paths, max_retries),
+            self._get_loop()
+        )
+        return future.result()
+
+    async def _shutdown(self):
+        """Stop the upload workers and close the shared HTTP session."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def close(self):
+        """Close the HTTP session and stop the background upload loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5)
+        except Exception as e:
+            logger.error(f"Error closing upload session: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
     @property
     def is_configured(self):
         """Check if ImageKit is properly configured."""
-        return self.imagekit is not None
+        return self._credentials is not None and self._auth_headers is not None
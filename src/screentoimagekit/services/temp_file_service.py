@@ -1,12 +1,15 @@
 """Service for managing temporary files."""
 
 import os
-import glob
+import asyncio
+import fnmatch
+import itertools
+import re
 import logging
 from pathlib import Path
 import time
-import uuid
 import tempfile
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -30,26 +33,145 @@ class TempFileService:
         os.makedirs(self.temp_dir, exist_ok=True)
         logger.debug(f"Using temporary directory: {self.temp_dir}")
         
-    def cleanup_temp_files(self, pattern="s_*.png"):
+        # Files handed out by generate_temp_path, so cleanup can skip the
+        # directory scan, and throttling state for repeated cleanups. Paths
+        # are handed out on worker threads, so the set is guarded by a lock
+        self._known_files = set()
+        self._known_lock = threading.Lock()
+        self._last_cleanup = None
+        self._cleanup_interval = 5.0
+        
+        # Compiled cleanup patterns, keyed by glob pattern
+        self._pattern_cache = {}
+        
+        # Counter and per-run tag (start time + pid) for temp file names
+        self._counter = itertools.count()
+        self._session_tag = f"{int(time.time()):x}{os.getpid():x}"
+        
+    def _compile_pattern(self, pattern):
+        """Compile a glob pattern to a regex matcher, caching the result.
+        
+        Args:
+            pattern (str): File pattern to match
+            
+        Returns:
+            callable: Match function taking a file name
+        """
+        matcher = self._pattern_cache.get(pattern)
+        if matcher is None:
+            # Match case-insensitively where the filesystem does (Windows)
+            flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+            matcher = re.compile(fnmatch.translate(pattern), flags).match
+            self._pattern_cache[pattern] = matcher
+        return matcher
+        
+    def _find_temp_files(self, pattern):
+        """List the files in the temp directory matching the given pattern.
+        
+        Args:
+            pattern (str): File pattern to match
+            
+        Returns:
+            list: Paths of the matching files
+        """
+        match = self._compile_pattern(pattern)
+        with os.scandir(self.temp_dir) as entries:
+            return [
+                entry.path for entry in entries
+                if match(entry.name) and entry.is_file(follow_symlinks=False)
+            ]
+        
+    def _select_cleanup_paths(self, pattern, force):
+        """Pick the temp files a cleanup should remove.
+        
+        Args:
+            pattern (str): File pattern to match for cleanup
+            force (bool): Run even if the last cleanup was too recent
+            
+        Returns:
+            list: Paths to unlink, or None if the cleanup is throttled
+        """
+        now = time.monotonic()
+        if not force and self._last_cleanup is not None and now - self._last_cleanup < self._cleanup_interval:
+            logger.debug("Skipping temporary file cleanup (throttled)")
+            return None
+        self._last_cleanup = now
+        
+        with self._known_lock:
+            known = list(self._known_files)
+        if force or not known:
+            # Forced cleanups (startup, shutdown) also catch files from
+            # earlier sessions and files not made by generate_temp_path
+            paths = set(self._find_temp_files(pattern))
+        else:
+            paths = set()
+        match = self._compile_pattern(pattern)
+        paths.update(path for path in known if match(os.path.basename(path)))
+        return list(paths)
+        
+    def _record_unlink(self, path, error):
+        """Log the outcome of removing a temp file and forget it if it is gone."""
+        if error is None or isinstance(error, FileNotFoundError):
+            with self._known_lock:
+                self._known_files.discard(path)
+            if error is None:
+                logger.debug(f"Removed temporary file: {path}")
+        else:
+            logger.error(f"Error removing temporary file {path}: {error}")
+        
+    async def cleanup_temp_files_async(self, pattern="s_*.png", force=False):
         """Clean up temporary files matching the given pattern.
         
+        For callers already running on an event loop: all matching files
+        are unlinked concurrently on worker threads. Cleanups are throttled
+        to one per cleanup interval unless forced. Unforced cleanups delete
+        the files created through generate_temp_path without scanning the
+        directory; forced ones, or ones with no known files, scan it too.
+        
         Args:
             pattern (str): File pattern to match for cleanup
+            force (bool): Run even if the last cleanup was too recent
             
         Returns:
             bool: True if cleanup was successful, False otherwise
         """
         try:
-            temp_path = Path(self.temp_dir)
-            screenshot_files = list(temp_path.glob(pattern))
+            paths = self._select_cleanup_paths(pattern, force)
+            if not paths:
+                return True
+            results = await asyncio.gather(
+                *(asyncio.to_thread(os.unlink, path) for path in paths),
+                return_exceptions=True
+            )
+            for path, result in zip(paths, results):
+                self._record_unlink(path, result if isinstance(result, Exception) else None)
+                    
+            return True
+        except Exception as e:
+            logger.error(f"Error during cleanup of temporary files: {e}")
+            return False
+            
+    def cleanup_temp_files(self, pattern="s_*.png", force=False):
+        """Clean up temporary files matching the given pattern.
+        
+        Unlinks the files one after another on the calling thread; a
+        handful of unlinks does not justify starting an event loop.
+        
+        Args:
+            pattern (str): File pattern to match for cleanup
+            force (bool): Run even if the last cleanup was too recent
             
-            for file_path in screenshot_files:
+        Returns:
+            bool: True if cleanup was successful, False otherwise
+        """
+        try:
+            for path in self._select_cleanup_paths(pattern, force) or ():
                 try:
-                    file_path.unlink()
-                    logger.debug(f"Removed temporary file: {file_path}")
+                    os.unlink(path)
                 except Exception as e:
-                    logger.error(f"Error removing temporary file {file_path}: {e}")
-                    
+                    self._record_unlink(path, e)
+                else:
+                    self._record_unlink(path, None)
             return True
         except Exception as e:
             logger.error(f"Error during cleanup of temporary files: {e}")
@@ -72,6 +194,8 @@ class TempFileService:
             if path.exists():
                 path.unlink()
                 logger.debug(f"Removed temporary file: {path}")
+            with self._known_lock:
+                self._known_files.discard(str(path))
             return True
         except Exception as e:
             logger.error(f"Error removing temporary file: {e}")
@@ -87,10 +211,23 @@ class TempFileService:
         Returns:
             str: Generated temporary file path
         """
-        # Get current time in milliseconds (last 4 digits)
-        timestamp = str(int(time.time() * 1000))[-4:]
-        # Get first 4 chars of a UUID for uniqueness
-        unique_id = str(uuid.uuid4())[:4]
-        # Combine for a short, unique filename
-        filename = f"{prefix}{timestamp}{unique_id}{suffix}"
-        return str(Path(self.temp_dir) / filename)
+        # Session tag plus a per-instance counter gives a short name that is
+        # unique without a clock read or random id per call
+        filename = f"{prefix}_{self._session_tag}_{next(self._counter):x}{suffix}"
+        temp_path = str(Path(self.temp_dir) / filename)
+        with self._known_lock:
+            self._known_files.add(temp_path)
+        return temp_path
+        
+    def record_rename(self, old_path, new_path):
+        """Keep track of a temporary file after it has been renamed.
+        
+        Args:
+            old_path (str): Path the file was created under
+            new_path (str): Path the file was moved to
+        """
+        old_path, new_path = str(Path(old_path)), str(Path(new_path))
+        with self._known_lock:
+            if old_path in self._known_files:
+                self._known_files.discard(old_path)
+                self._known_files.add(new_path)
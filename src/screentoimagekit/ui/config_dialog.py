@@ -8,15 +8,19 @@ class ConfigDialog(tk.Toplevel):
 
     def __init__(self, parent):
         super().__init__(parent)
+        # Build and position the dialog while unmapped so it is laid out
+        # once and shown in its final place, without flicker
+        self.withdraw()
         self.title("ImageKit Configuration")
         self.result = None
         self._init_ui()
         self._center_dialog(parent)
+        self.deiconify()
+        self.grab_set()
 
     def _init_ui(self):
         """Initialize dialog UI elements."""
         self.transient(self.master)
-        self.grab_set()
 
         # Create form fields
         self._create_form_fields()
@@ -24,26 +28,18 @@ class ConfigDialog(tk.Toplevel):
 
     def _create_form_fields(self):
         """Create and layout form fields."""
-        # Private Key
-        tk.Label(self, text="Private Key:").grid(
-            row=0, column=0, padx=5, pady=5, sticky="e"
-        )
-        self.private_key = ttk.Entry(self, width=50)
-        self.private_key.grid(row=0, column=1, padx=5, pady=5)
-
-        # Public Key
-        tk.Label(self, text="Public Key:").grid(
-            row=1, column=0, padx=5, pady=5, sticky="e"
-        )
-        self.public_key = ttk.Entry(self, width=50)
-        self.public_key.grid(row=1, column=1, padx=5, pady=5)
-
-        # URL Endpoint
-        tk.Label(self, text="URL Endpoint:").grid(
-            row=2, column=0, padx=5, pady=5, sticky="e"
+        fields = (
+            ("Private Key:", "private_key"),
+            ("Public Key:", "public_key"),
+            ("URL Endpoint:", "url_endpoint"),
         )
-        self.url_endpoint = ttk.Entry(self, width=50)
-        self.url_endpoint.grid(row=2, column=1, padx=5, pady=5)
+        for row, (label, attr) in enumerate(fields):
+            ttk.Label(self, text=label).grid(
+                row=row, column=0, padx=5, pady=5, sticky="e"
+            )
+            entry = ttk.Entry(self, width=50)
+            entry.grid(row=row, column=1, padx=5, pady=5)
+            setattr(self, attr, entry)
 
     def _create_buttons(self):
         """Create and layout dialog buttons."""
@@ -2,10 +2,77 @@
 
 import tkinter as tk
 from tkinter import ttk, colorchooser
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageColor, ImageDraw, ImageTk
 from enum import Enum, auto
+from functools import lru_cache, partial
 from typing import Optional, Tuple, List
 import math
+from array import array
+from itertools import cycle
+from ..utils.geometry import point_segment_distance_sq, simplify_polyline
+
+# Cell size in pixels of the grid used to look up elements under the cursor
+_GRID_CELL_SIZE = 64
+# Extra pixels around an element's bounds that still count as a hit
+_HIT_TOLERANCE = 3
+# Arrowhead sides sit 30 degrees either side of the shaft
+_COS30 = math.cos(math.pi / 6)
+_SIN30 = 0.5
+# Maximum deviation in pixels allowed when simplifying freehand strokes
+_FREEHAND_EPSILON = 1.5
+# While drawing, simplify the stroke once this many raw points pile up,
+# leaving the newest few untouched so the live line still follows the cursor
+_LIVE_SIMPLIFY_POINTS = 128
+_LIVE_RAW_POINTS = 16
+# Freehand samples closer than this (Manhattan, in pixels) to the last one are dropped
+_MIN_SAMPLE_DISTANCE = 2
+# Minimum milliseconds between canvas updates while dragging (~60 fps)
+_MOTION_INTERVAL_MS = 16
+# Canvas tags separating the screenshot from the annotations drawn over it
+_BG_TAG = "bg"
+_FG_TAG = "fg"
+# Selection rectangles, kept above every annotation item
+_SELECTION_TAG = "selection"
+
+# Size and spacing in pixels of the color palette swatches
+_SWATCH_SIZE = 20
+_SWATCH_GAP = 6
+
+@lru_cache(maxsize=256)
+def _color_rgba(color):
+    """Convert a Tk color string to an opaque RGBA tuple for the annotation layer."""
+    if len(color) == 7 and color[0] == '#':
+        r, g, b = bytes.fromhex(color[1:])
+        return r, g, b, 255
+    return ImageColor.getrgb(color)[:3] + (255,)
+
+# Single tooltip window shared by every toolbar widget (created on first hover)
+_TOOLTIP = None
+_TOOLTIP_TEXT = None
+
+def _get_tooltip():
+    """Get the shared tooltip window, creating it withdrawn if needed."""
+    global _TOOLTIP, _TOOLTIP_TEXT
+    if _TOOLTIP is None or not _TOOLTIP.winfo_exists():
+        _TOOLTIP = tk.Toplevel()
+        _TOOLTIP.withdraw()
+        _TOOLTIP.wm_overrideredirect(True)
+        _TOOLTIP_TEXT = tk.StringVar(_TOOLTIP)
+        ttk.Label(_TOOLTIP, textvariable=_TOOLTIP_TEXT, background="#ffffe0",
+                  relief='solid', borderwidth=1).pack()
+    return _TOOLTIP
+
+def _show_tooltip(text, event):
+    """Show the shared tooltip with the given text next to the mouse pointer."""
+    tooltip = _get_tooltip()
+    _TOOLTIP_TEXT.set(text)
+    tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+    tooltip.deiconify()
+
+def _hide_tooltip(event=None):
+    """Hide the shared tooltip if it is showing."""
+    if _TOOLTIP is not None and _TOOLTIP.winfo_exists():
+        _TOOLTIP.withdraw()
 
 class DrawingTool(Enum):
     """Enumeration of available drawing tools."""
@@ -19,14 +86,28 @@ class DrawingTool(Enum):
     SPEECH_BUBBLE = auto()
     COUNTER = auto()
 
+# Tool buttons shown in the toolbar, in order
+_TOOLBAR_TOOLS = (
+    ("Rectangle", DrawingTool.RECTANGLE),
+    ("Ellipse", DrawingTool.ELLIPSE),
+    ("Line", DrawingTool.LINE),
+    ("Arrow", DrawingTool.ARROW),
+    ("Freehand", DrawingTool.FREEHAND),
+    ("Text", DrawingTool.TEXT)
+)
+_TOOL_BUTTON_STYLE = 'Tool.TButton'
+
 class DrawingElement:
     """Base class for drawing elements."""
+    __slots__ = ('tool_type', 'x1', 'y1', 'x2', 'y2', 'color', 'fill', 'width', 'font',
+                 'text', 'angle', 'locked', 'points', 'counter_value', 'effect_strength')
+
     def __init__(self, tool_type: DrawingTool, x1: int, y1: int, x2: int = None, y2: int = None):
         self.tool_type = tool_type
         self.x1 = x1
         self.y1 = y1
-        self.x2 = x2 or x1
-        self.y2 = y2 or y1
+        self.x2 = x1 if x2 is None else x2
+        self.y2 = y1 if y2 is None else y2
         self.color = "#000000"
         self.fill = ''  # Empty string for transparent fill
         self.width = 2
@@ -34,7 +115,7 @@ class DrawingElement:
         self.text = ""
         self.angle = 0
         self.locked = False
-        self.points = []  # For freehand drawing
+        self.points = array('i')  # Flat [x0, y0, x1, y1, ...] for freehand drawing
         self.counter_value = 1  # For counter tool
         self.effect_strength = 10  # For pixelate/blur effects
 
@@ -74,20 +155,13 @@ class DrawingToolbar(ttk.Frame):
         tools_frame = ttk.Frame(toolbar_frame)
         tools_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
 
-        # Add tool buttons horizontally
-        tools = [
-            ("Rectangle", DrawingTool.RECTANGLE),
-            ("Ellipse", DrawingTool.ELLIPSE),
-            ("Line", DrawingTool.LINE),
-            ("Arrow", DrawingTool.ARROW),
-            ("Freehand", DrawingTool.FREEHAND),
-            ("Text", DrawingTool.TEXT)
-        ]
+        # Consistent button size comes from one named style
+        ttk.Style(self).configure(_TOOL_BUTTON_STYLE, width=10)
 
-        # Create tool buttons with consistent size and spacing
-        for text, tool in tools:
-            btn = ttk.Button(tools_frame, text=text, width=10,
-                           command=lambda t=tool: self._select_tool(t))
+        # Create tool buttons horizontally with consistent spacing
+        for text, tool in _TOOLBAR_TOOLS:
+            btn = ttk.Button(tools_frame, text=text, style=_TOOL_BUTTON_STYLE,
+                             command=partial(self._select_tool, tool))
             btn.pack(side=tk.LEFT, padx=2)
 
         # Color selection frame
@@ -110,44 +184,29 @@ class DrawingToolbar(ttk.Frame):
         ttk.Label(color_frame, text="Colors:").pack(side=tk.LEFT, padx=(0, 5))
 
         # Create color selection boxes
-        for color_name, color_code in self.colors.items():
-            self._create_color_button(color_frame, color_code, color_name)
-
-    def _create_color_button(self, parent, color, name):
-        """Create a color selection button."""
-        # Create a frame for the color box with white border
-        frame = ttk.Frame(parent, style='ColorBox.TFrame')
-        frame.pack(side=tk.LEFT, padx=2)
-        
-        # Create canvas for color box
-        canvas = tk.Canvas(frame, width=20, height=20, highlightthickness=1,
-                         highlightbackground='#666666', bg=color)
-        canvas.pack(padx=1, pady=1)
-        
-        # Bind click event
-        canvas.bind('<Button-1>', lambda e, c=color: self._select_color(c))
+        self._create_color_palette(color_frame)
+
+    def _create_color_palette(self, parent):
+        """Create the color selection boxes as items on a single canvas."""
+        step = _SWATCH_SIZE + _SWATCH_GAP
+        palette = tk.Canvas(parent, width=step * len(self.colors), height=_SWATCH_SIZE + 2,
+                            highlightthickness=0)
+        palette.pack(side=tk.LEFT)
         
-        # Add tooltip
-        self._add_tooltip(canvas, name)
+        for index, (color_name, color_code) in enumerate(self.colors.items()):
+            x = index * step + _SWATCH_GAP // 2
+            item = palette.create_rectangle(x, 1, x + _SWATCH_SIZE, _SWATCH_SIZE + 1,
+                                            fill=color_code, outline='#666666')
+            # Bind click event and tooltip on the swatch item
+            palette.tag_bind(item, '<Button-1>', partial(self._select_color, color_code))
+            palette.tag_bind(item, '<Enter>', partial(_show_tooltip, color_name))
+            palette.tag_bind(item, '<Leave>', _hide_tooltip)
 
     def _add_tooltip(self, widget, text):
         """Add tooltip to widget."""
-        def show_tooltip(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            
-            label = ttk.Label(tooltip, text=text, background="#ffffe0", 
-                            relief='solid', borderwidth=1)
-            label.pack()
-            
-            def hide_tooltip():
-                tooltip.destroy()
-            
-            widget.tooltip = tooltip
-            widget.bind('<Leave>', lambda e: hide_tooltip())
-            
-        widget.bind('<Enter>', show_tooltip)
+        # Both handlers are bound once here, never from inside a handler
+        widget.bind('<Enter>', partial(_show_tooltip, text))
+        widget.bind('<Leave>', _hide_tooltip)
 
     def _select_tool(self, tool):
         """Handle tool selection."""
@@ -176,10 +235,9 @@ class DrawingToolbar(ttk.Frame):
             element.color = self.current_color
             element.width = self.canvas.current_width
             
-            self.canvas.elements.append(element)
-            self.canvas._update_canvas()
+            self.canvas.add_element(element)
 
-    def _select_color(self, color):
+    def _select_color(self, color, event=None):
         """Handle color selection."""
         self.current_color = color
         # Update current color indicator
@@ -191,7 +249,7 @@ class DrawingToolbar(ttk.Frame):
             # Update selected elements
             for element in self.canvas.selected_elements:
                 element.color = color
-            self.canvas._update_canvas()
+                self.canvas._invalidate(element)
 
     def set_canvas(self, canvas):
         """Set the associated drawing canvas."""
@@ -213,29 +271,69 @@ class DrawingCanvas(tk.Canvas):
         self.current_color = '#000000'
         self.current_width = 2
         self.elements = []
-        self.selected_elements = set()
+        self._selected = set()  # Indices into self.elements of the selection
+        self._positions = {}  # DrawingElement -> index in self.elements
         self.dragging = False
         self.last_x = None
         self.last_y = None
         self.start_x = None
         self.start_y = None
         self.temp_element = None
+        self._temp_item_ids = ()  # Canvas items of the shape being dragged
+        self._item_ids = {}  # DrawingElement -> tuple of its canvas item ids
+        self._selection_ids = {}  # Element index -> selection rectangle item id
+        self._spatial = {}  # (cell_x, cell_y) -> indices of elements touching the cell
+        self._element_cells = {}  # Element index -> cells it was indexed under
+        self._bounds = {}  # DrawingElement -> padded (left, top, right, bottom)
         self.original_image = image
-        self.freehand_points = []
+        self._annot_buf = None  # RGBA layer holding finished freehand strokes
+        self._rasterized = []  # Freehand elements drawn into _annot_buf, in order
+        self._annot_draw = None
+        self._annot_photo = None  # Background composited with _annot_buf
+        self._base_rgba = None  # RGBA copy of the screenshot used for compositing
+        self._bg_refresh_pending = False  # Recomposite queued for the next idle cycle
+        self._redraw_pending = False  # A redraw was skipped while the canvas was hidden
+        self._dirty = None  # Union of the bounds of elements changed since the last flush
+        self._dirty_elements = []  # Elements whose appearance changed
+        self._dirty_after_id = None  # Scheduled _flush_dirty callback, if any
+        self.freehand_points = array('i')  # Flat coords of the stroke in progress
+        self._freehand_item = None  # Canvas line item of the stroke in progress
+        self._freehand_frozen = 0  # Coords at the start of the stroke already simplified
+        self._pending_motion = None  # Latest (x, y) drag position not yet drawn
+        self._motion_after_id = None  # Scheduled _flush_motion callback, if any
         
         # Create PhotoImage for display
         self.photo_image = ImageTk.PhotoImage(image)
         
         # Configure canvas size and scrolling
         self.configure(width=image.width, height=image.height)
-        self.create_image(0, 0, anchor='nw', image=self.photo_image)
+        self._bg_id = self.create_image(0, 0, anchor='nw', image=self.photo_image, tags=(_BG_TAG,))
+        self.tag_lower(self._bg_id)
         self.configure(scrollregion=(0, 0, image.width, image.height))
         
+        # Draw helper for each tool type, looked up once per element
+        self._draw_dispatch = {
+            DrawingTool.RECTANGLE: self._draw_rectangle_element,
+            DrawingTool.ELLIPSE: self._draw_ellipse_element,
+            DrawingTool.LINE: self._draw_line_element,
+            DrawingTool.ARROW: self._draw_arrow_element,
+            DrawingTool.FREEHAND: self._draw_freehand_element,
+            DrawingTool.TEXT: self._draw_text_element
+        }
+        
         # Bind mouse events
         self.bind('<Button-1>', self._on_mouse_down)
         self.bind('<B1-Motion>', self._on_mouse_drag)
         self.bind('<ButtonRelease-1>', self._on_mouse_up)
         self.bind('<Button-3>', self._on_right_click)
+        self.bind('<Map>', self._on_map)
+
+    def _on_map(self, event=None):
+        """Catch up on a background recomposite skipped while the canvas was hidden."""
+        if self._redraw_pending:
+            self._redraw_pending = False
+            self._sync_annotation_layer()
+            self._request_background_refresh()
 
     def _on_mouse_down(self, event):
         """Handle mouse down event."""
@@ -246,139 +344,513 @@ class DrawingCanvas(tk.Canvas):
         self.start_y = event.y
         
         if self.current_tool == DrawingTool.FREEHAND:
-            self.freehand_points = [(event.x, event.y)]
+            self.freehand_points = array('i', (event.x, event.y))
+            self._freehand_frozen = 0
             self.temp_element = DrawingElement(DrawingTool.FREEHAND, event.x, event.y)
             self.temp_element.points = self.freehand_points
             self.temp_element.color = self.current_color
             self.temp_element.width = self.current_width
+            # One line item per stroke; drag events only extend its coords
+            self._freehand_item = self.create_line(
+                event.x, event.y, event.x, event.y,
+                fill=self.current_color, width=self.current_width, tags=(_FG_TAG,)
+            )
 
     def _on_mouse_drag(self, event):
-        """Handle mouse drag event."""
+        """Handle mouse drag event.
+
+        Motion events arrive at the mouse polling rate, so the canvas is
+        updated at most once per _MOTION_INTERVAL_MS with the latest position.
+        """
         if not self.dragging:
             return
             
+        if self.current_tool == DrawingTool.FREEHAND:
+            points = self.freehand_points
+            if abs(event.x - points[-2]) + abs(event.y - points[-1]) < _MIN_SAMPLE_DISTANCE:
+                return
+            self.freehand_points.extend((event.x, event.y))
+            if len(self.freehand_points) - self._freehand_frozen >= 2 * _LIVE_SIMPLIFY_POINTS:
+                self._simplify_live_stroke()
+        self._pending_motion = (event.x, event.y)
+        if self._motion_after_id is None:
+            self._motion_after_id = self.after(_MOTION_INTERVAL_MS, self._flush_motion)
+
+    def _simplify_live_stroke(self):
+        """Simplify the stroke in progress except for its newest samples.
+
+        Each pass starts at the last vertex kept by the previous one, so
+        already simplified coordinates are not processed again.
+        """
+        points = self.freehand_points
+        start = max(self._freehand_frozen - 2, 0)
+        end = len(points) - 2 * _LIVE_RAW_POINTS
+        # Both chunk endpoints are kept, so the stroke stays connected
+        chunk = simplify_polyline(points[start:end], _FREEHAND_EPSILON)
+        points[start:end] = array('i', chunk)
+        self._freehand_frozen = start + len(chunk)
+
+    def _flush_motion(self):
+        """Apply the latest pending drag position to the canvas."""
+        self._motion_after_id = None
+        if self._pending_motion is None or not self.dragging:
+            return
+        x, y = self._pending_motion
+        self._pending_motion = None
+            
         if self.current_tool == DrawingTool.SELECT:
-            self._select_element(event.x, event.y)
+            self._select_element(x, y)
         elif self.current_tool == DrawingTool.FREEHAND:
-            self.freehand_points.append((event.x, event.y))
-            self._update_canvas()
+            if self._freehand_item is not None:
+                self.coords(self._freehand_item, *self.freehand_points)
         else:
             if not self.temp_element:
                 self.temp_element = DrawingElement(self.current_tool, self.start_x, self.start_y)
                 self.temp_element.color = self.current_color
                 self.temp_element.width = self.current_width
-            self.temp_element.x2 = event.x
-            self.temp_element.y2 = event.y
-            self._update_canvas()
+                self.temp_element.x2 = x
+                self.temp_element.y2 = y
+                self._temp_item_ids = self._draw_element_on_canvas(self.temp_element)
+            else:
+                # Only move the rubber-band items; the rest of the canvas is untouched
+                self.temp_element.x2 = x
+                self.temp_element.y2 = y
+                self._move_element_items(self.temp_element, self._temp_item_ids)
 
     def _on_mouse_up(self, event):
         """Handle mouse up event."""
         if not self.dragging:
             return
             
+        # Draw the final drag position before finishing the element
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+            self._flush_motion()
         self.dragging = False
         if self.current_tool != DrawingTool.SELECT:
             if self.temp_element:
+                # The items drawn while dragging become the element's items
                 if self.current_tool == DrawingTool.FREEHAND:
-                    if len(self.freehand_points) > 1:
-                        self.elements.append(self.temp_element)
-                    self.freehand_points = []
+                    if len(self.freehand_points) > 2:
+                        # Drop near-collinear samples so later redraws stay cheap
+                        self.temp_element.points = array('i', simplify_polyline(
+                            self.freehand_points, _FREEHAND_EPSILON))
+                        # Finished strokes live in the raster layer, not as Tk items
+                        self._register_element(self.temp_element, ())
+                        self._rasterize_freehand(self.temp_element)
+                        self._request_background_refresh()
+                    if self._freehand_item is not None:
+                        self.delete(self._freehand_item)
+                    self.freehand_points = array('i')
+                    self._freehand_item = None
                 else:
-                    self.elements.append(self.temp_element)
+                    self._register_element(self.temp_element, self._temp_item_ids)
                 self.temp_element = None
-                self._update_canvas()
+                self._temp_item_ids = ()
 
     def _on_right_click(self, event):
         """Handle right click event."""
         self._select_element(event.x, event.y)
 
+    def add_element(self, element):
+        """Add a completed element and draw it.
+
+        Args:
+            element: DrawingElement to add
+        """
+        self._register_element(element, self._draw_element_on_canvas(element))
+
+    def _register_element(self, element, item_ids):
+        """Append an element and record its canvas items, position and bounds."""
+        self._positions[element] = len(self.elements)
+        self.elements.append(element)
+        self._item_ids[element] = item_ids
+        self._index_element(element, self._positions[element])
+        if item_ids and self._selection_ids:
+            # New items stack on top; keep the selection visible above them
+            self.tag_raise(_SELECTION_TAG)
+
+    @property
+    def selected_elements(self):
+        """list: Selected elements, in drawing order."""
+        return [self.elements[index] for index in sorted(self._selected)]
+
+    @selected_elements.setter
+    def selected_elements(self, elements):
+        self._selected = {self._positions[element] for element in elements}
+        self._update_selection()
+
+    def _element_bounds(self, element):
+        """Get the bounding box of an element, padded by the hit tolerance.
+
+        Returns:
+            tuple: (left, top, right, bottom) in canvas coordinates
+        """
+        if element.tool_type == DrawingTool.FREEHAND and element.points:
+            xs = element.points[0::2]
+            ys = element.points[1::2]
+            left, top, right, bottom = min(xs), min(ys), max(xs), max(ys)
+        elif element.tool_type == DrawingTool.TEXT and self._item_ids.get(element):
+            # Text only has an anchor point; its extent comes from the canvas
+            left, top, right, bottom = self.bbox(self._item_ids[element][0])
+        else:
+            left, right = min(element.x1, element.x2), max(element.x1, element.x2)
+            top, bottom = min(element.y1, element.y2), max(element.y1, element.y2)
+        pad = element.width // 2 + _HIT_TOLERANCE
+        return left - pad, top - pad, right + pad, bottom + pad
+
+    def _index_element(self, element, index):
+        """Add an element to the spatial grid used for hit testing.
+
+        Args:
+            element: DrawingElement to index
+            index (int): Position of the element in self.elements
+        """
+        bounds = self._element_bounds(element)
+        self._bounds[element] = bounds
+        left, top, right, bottom = bounds
+        cells = [
+            (cx, cy)
+            for cx in range(int(left) // _GRID_CELL_SIZE, int(right) // _GRID_CELL_SIZE + 1)
+            for cy in range(int(top) // _GRID_CELL_SIZE, int(bottom) // _GRID_CELL_SIZE + 1)
+        ]
+        for cell in cells:
+            self._spatial.setdefault(cell, []).append(index)
+        self._element_cells[index] = cells
+
+    def _unindex_element(self, element, index):
+        """Remove an element from the spatial grid."""
+        self._bounds.pop(element, None)
+        for cell in self._element_cells.pop(index, ()):
+            bucket = self._spatial.get(cell)
+            if bucket:
+                bucket.remove(index)
+                if not bucket:
+                    del self._spatial[cell]
+
+    def _is_point_in_element(self, element, x, y):
+        """Check whether a point hits an element.
+
+        The padded bounding box is tested first; lines, arrows and freehand
+        strokes are then refined by their distance to the point, since their
+        boxes are mostly empty space. Distances are compared squared.
+        """
+        bounds = self._bounds.get(element) or self._element_bounds(element)
+        left, top, right, bottom = bounds
+        if not (left <= x <= right and top <= y <= bottom):
+            return False
+        if element.tool_type in (DrawingTool.LINE, DrawingTool.ARROW):
+            reach = element.width / 2 + _HIT_TOLERANCE
+            return point_segment_distance_sq(
+                x, y, element.x1, element.y1, element.x2, element.y2) <= reach * reach
+        if element.tool_type == DrawingTool.FREEHAND:
+            reach_sq = (element.width / 2 + _HIT_TOLERANCE) ** 2
+            points = element.points
+            for i in range(0, len(points) - 2, 2):
+                if point_segment_distance_sq(x, y, points[i], points[i + 1],
+                                             points[i + 2], points[i + 3]) <= reach_sq:
+                    return True
+            return False
+        return True
+
     def _select_element(self, x, y):
         """Select element at the given coordinates."""
-        for element in reversed(self.elements):
-            if self._is_point_in_element(element, x, y):
-                self.selected_elements = {element}
+        # Only elements indexed under the cursor's cell can be hit; buckets
+        # keep drawing order, so the last match is the topmost element
+        candidates = self._spatial.get((x // _GRID_CELL_SIZE, y // _GRID_CELL_SIZE), ())
+        for index in reversed(candidates):
+            if self._is_point_in_element(self.elements[index], x, y):
+                self._selected = {index}
                 break
-        self._update_canvas()
+        self._update_selection()
 
-    def _update_canvas(self):
-        """Redraw all elements on the canvas."""
-        # Clear canvas
-        self.delete("all")
-        self.create_image(0, 0, anchor='nw', image=self.photo_image)
-        
-        # Draw all completed elements
+    def _update_selection(self):
+        """Sync the selection rectangles with the selected indices."""
+        for index in list(self._selection_ids):
+            if index not in self._selected:
+                self.delete(self._selection_ids.pop(index))
+        for index in self._selected:
+            if index not in self._selection_ids:
+                self._selection_ids[index] = self._draw_selection(self.elements[index])
+
+    def _draw_selection(self, element):
+        """Draw the selection indicator for an element.
+
+        Returns:
+            int: Canvas item id of the selection rectangle
+        """
+        return self.create_rectangle(
+            *self._selection_box(element),
+            outline='#00FF00', width=1, dash=(2, 2), tags=(_FG_TAG, _SELECTION_TAG)
+        )
+
+    @staticmethod
+    def _selection_box(element):
+        """Get the selection rectangle coordinates for an element."""
+        x1, y1, x2, y2 = element.x1, element.y1, element.x2, element.y2
+        return (min(x1, x2) - 2, min(y1, y2) - 2,
+                max(x1, x2) + 2, max(y1, y2) + 2)
+
+    def _rasterize_freehand(self, element):
+        """Draw a finished freehand stroke into the annotation layer."""
+        if self._annot_buf is None:
+            self._annot_buf = Image.new('RGBA', self.original_image.size, (0, 0, 0, 0))
+            self._annot_draw = ImageDraw.Draw(self._annot_buf)
+        self._annot_draw.line(element.points.tolist(),
+                              fill=_color_rgba(element.color), width=element.width, joint='curve')
+        self._rasterized.append(element)
+
+    def _rebuild_annotation_layer(self):
+        """Re-rasterize every freehand stroke into a fresh annotation layer."""
+        self._annot_buf = None
+        self._rasterized = []
         for element in self.elements:
-            self._draw_element_on_canvas(element)
-        
-        # Draw current element being created
-        if self.temp_element:
-            self._draw_element_on_canvas(self.temp_element)
-        
-        # Draw selection indicators
-        for element in self.selected_elements:
-            x1, y1 = element.x1, element.y1
-            x2, y2 = getattr(element, 'x2', x1), getattr(element, 'y2', y1)
-            self.create_rectangle(
-                min(x1, x2) - 2, min(y1, y2) - 2,
-                max(x1, x2) + 2, max(y1, y2) + 2,
-                outline='#00FF00', width=1, dash=(2, 2)
-            )
+            if element.tool_type == DrawingTool.FREEHAND:
+                self._rasterize_freehand(element)
+                self._item_ids[element] = ()
 
-    def _draw_element_on_canvas(self, element):
-        """Draw a single element on the canvas."""
-        if element.tool_type in [DrawingTool.LINE, DrawingTool.FREEHAND]:
-            kwargs = {
-                'fill': element.color,
-                'width': element.width
-            }
+    def _sync_annotation_layer(self):
+        """Bring the annotation layer up to date with the freehand strokes.
+
+        Strokes added since the last sync are drawn on top of the layer.
+        Recolors are repainted by _flush_dirty, so the layer is only rebuilt
+        from scratch when a stroke was removed or the order changed.
+
+        Returns:
+            bool: True if the layer changed
+        """
+        strokes = [element for element in self.elements
+                   if element.tool_type == DrawingTool.FREEHAND]
+        done = len(self._rasterized)
+        if len(strokes) < done or any(a is not b for a, b in zip(strokes, self._rasterized)):
+            self._rebuild_annotation_layer()
+            return True
+        for element in strokes[done:]:
+            self._rasterize_freehand(element)
+            self._item_ids[element] = ()
+        return len(strokes) > done
+
+    def _request_background_refresh(self):
+        """Schedule a single background recomposite for the next idle cycle."""
+        if not self._bg_refresh_pending:
+            self._bg_refresh_pending = True
+            self.after_idle(self._refresh_background)
+
+    def _refresh_background(self):
+        """Show the screenshot with the annotation layer composited over it."""
+        self._bg_refresh_pending = False
+        if not self.winfo_viewable():
+            # Nothing to show; the <Map> handler redraws once visible again
+            self._redraw_pending = True
+            return
+        if self._annot_buf is None:
+            self.itemconfigure(self._bg_id, image=self.photo_image)
+            return
+        if self._base_rgba is None:
+            # Converted once; the screenshot itself never changes
+            self._base_rgba = self.original_image.convert('RGBA')
+        composite = Image.alpha_composite(self._base_rgba, self._annot_buf)
+        if self._annot_photo is None:
+            self._annot_photo = ImageTk.PhotoImage(composite)
         else:
-            kwargs = {
-                'fill': '',
-                'outline': element.color,
-                'width': element.width
-            }
+            # Reuse the existing Tk image; only its pixels change
+            self._annot_photo.paste(composite)
+        self.itemconfigure(self._bg_id, image=self._annot_photo)
+
+    def _invalidate(self, element):
+        """Mark an element's appearance as changed and schedule a repaint."""
+        left, top, right, bottom = self._bounds.get(element) or self._element_bounds(element)
+        if self._dirty is None:
+            self._dirty = (left, top, right, bottom)
+        else:
+            self._dirty = (min(self._dirty[0], left), min(self._dirty[1], top),
+                           max(self._dirty[2], right), max(self._dirty[3], bottom))
+        if element not in self._dirty_elements:
+            self._dirty_elements.append(element)
+        if self._dirty_after_id is None:
+            self._dirty_after_id = self.after_idle(self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Repaint only what changed since the last flush.
+
+        Tk items of changed elements are restyled in place. If a freehand
+        stroke changed, only the dirty rectangle of the annotation layer is
+        redrawn, from the strokes that intersect it.
+        """
+        self._dirty_after_id = None
+        dirty, self._dirty = self._dirty, None
+        elements, self._dirty_elements = self._dirty_elements, []
+        if dirty is None:
+            return
+        
+        raster_dirty = False
+        for element in elements:
+            if element.tool_type == DrawingTool.FREEHAND:
+                raster_dirty = True
+            else:
+                self._restyle_items(element, self._item_ids.get(element, ()))
         
-        if element.tool_type == DrawingTool.RECTANGLE:
-            self.create_rectangle(element.x1, element.y1, element.x2, element.y2, **kwargs)
-        elif element.tool_type == DrawingTool.ELLIPSE:
-            self.create_oval(element.x1, element.y1, element.x2, element.y2, **kwargs)
+        if raster_dirty and self._annot_buf is not None:
+            width, height = self._annot_buf.size
+            left, top = max(0, int(dirty[0])), max(0, int(dirty[1]))
+            right, bottom = min(width, int(dirty[2]) + 1), min(height, int(dirty[3]) + 1)
+            if left < right and top < bottom:
+                # Redraw the strokes touching the rectangle into a clipped tile
+                tile = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+                draw = ImageDraw.Draw(tile)
+                for element in self.elements:
+                    if element.tool_type != DrawingTool.FREEHAND:
+                        continue
+                    b = self._bounds.get(element) or self._element_bounds(element)
+                    if b[0] > right or b[2] < left or b[1] > bottom or b[3] < top:
+                        continue
+                    draw.line([coord - offset for coord, offset in zip(element.points, cycle((left, top)))],
+                              fill=_color_rgba(element.color), width=element.width, joint='curve')
+                self._annot_buf.paste(tile, (left, top))
+                self._request_background_refresh()
+
+    def _restyle_items(self, element, item_ids):
+        """Apply an element's current color and width to its existing canvas items."""
+        if not item_ids:
+            return
+        if element.tool_type == DrawingTool.TEXT:
+            self.itemconfigure(item_ids[0], fill=element.color)
         elif element.tool_type == DrawingTool.LINE:
-            self.create_line(element.x1, element.y1, element.x2, element.y2, **kwargs)
+            self.itemconfigure(item_ids[0], fill=element.color, width=element.width)
         elif element.tool_type == DrawingTool.ARROW:
-            self._draw_arrow(element.x1, element.y1, element.x2, element.y2, element.color, element.width)
-        elif element.tool_type == DrawingTool.FREEHAND:
-            if hasattr(element, 'points') and len(element.points) > 1:
-                self.create_line(*[coord for point in element.points for coord in point], **kwargs)
-        elif element.tool_type == DrawingTool.TEXT:
-            if hasattr(element, 'text') and element.text:
-                self.create_text(element.x1, element.y1, text=element.text,
-                               fill=element.color, anchor='nw')
+            self.itemconfigure(item_ids[0], fill=element.color, width=element.width,
+                               arrowshape=self._arrow_shape(element.width))
+        else:
+            self.itemconfigure(item_ids[0], outline=element.color, width=element.width)
+
+    def _draw_element_on_canvas(self, element):
+        """Draw a single element on the canvas.
+
+        Returns:
+            tuple: Ids of the canvas items created for the element
+        """
+        draw = self._draw_dispatch.get(element.tool_type)
+        return draw(element) if draw else ()
+
+    def _draw_rectangle_element(self, element):
+        """Draw a rectangle element."""
+        return (self.create_rectangle(element.x1, element.y1, element.x2, element.y2,
+                                      fill='', outline=element.color, width=element.width,
+                                      tags=(_FG_TAG,)),)
+
+    def _draw_ellipse_element(self, element):
+        """Draw an ellipse element."""
+        return (self.create_oval(element.x1, element.y1, element.x2, element.y2,
+                                 fill='', outline=element.color, width=element.width,
+                                 tags=(_FG_TAG,)),)
+
+    def _draw_line_element(self, element):
+        """Draw a straight line element."""
+        return (self.create_line(element.x1, element.y1, element.x2, element.y2,
+                                 fill=element.color, width=element.width, tags=(_FG_TAG,)),)
+
+    def _draw_arrow_element(self, element):
+        """Draw an arrow element."""
+        return self._draw_arrow(element.x1, element.y1, element.x2, element.y2,
+                                element.color, element.width)
+
+    def _draw_freehand_element(self, element):
+        """Draw a freehand element as a Tk line."""
+        if len(element.points) > 2:
+            return (self.create_line(*element.points, fill=element.color,
+                                     width=element.width, tags=(_FG_TAG,)),)
+        return ()
+
+    def _draw_text_element(self, element):
+        """Draw a text element."""
+        if element.text:
+            return (self.create_text(element.x1, element.y1, text=element.text,
+                                     fill=element.color, anchor='nw',
+                                     tags=(_FG_TAG,)),)
+        return ()
+
+    def _move_element_items(self, element, item_ids):
+        """Move an element's existing canvas items to its current coordinates.
+
+        Args:
+            element: DrawingElement whose coordinates changed
+            item_ids: Canvas item ids returned by _draw_element_on_canvas
+        """
+        if not item_ids:
+            return
+        if element.tool_type == DrawingTool.TEXT:
+            self.coords(item_ids[0], element.x1, element.y1)
+            self.itemconfigure(item_ids[0], text=element.text)
+            return
+        self.coords(item_ids[0], element.x1, element.y1, element.x2, element.y2)
 
     def _draw_arrow(self, x1, y1, x2, y2, color, width):
-        """Draw an arrow line with arrowhead."""
-        # Draw the line
-        self.create_line(x1, y1, x2, y2, fill=color, width=width)
-        
-        # Calculate arrowhead
-        angle = math.atan2(y2 - y1, x2 - x1)
+        """Draw an arrow line with arrowhead.
+
+        The head is drawn by Tk as part of the line item, so moving the
+        arrow is a single coords call.
+
+        Returns:
+            tuple: Id of the arrow line item
+        """
+        return (self.create_line(x1, y1, x2, y2, fill=color, width=width, arrow=tk.LAST,
+                                 arrowshape=self._arrow_shape(width), tags=(_FG_TAG,)),)
+
+    @staticmethod
+    def _arrow_shape(width):
+        """Get the Tk arrowshape matching the triangle from _arrow_head_points."""
         arrow_size = 10 + width
-        
-        # Calculate points for arrowhead
-        points = [
+        # Tip to back along the shaft, and back corner distance beyond the line edge
+        depth = arrow_size * _COS30
+        return (depth, depth, max(arrow_size * _SIN30 - width / 2, 1))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _arrow_head_points(x1, y1, x2, y2, width):
+        """Calculate the arrowhead triangle for an arrow from (x1, y1) to (x2, y2).
+
+        Cached on the geometry, so syncs and exports of an arrow that has
+        not moved reuse the same triangle.
+
+        Returns:
+            tuple: Flat (x, y) coordinates of the three corners
+        """
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        if not length:
+            return (x2, y2, x2, y2, x2, y2)
+        # Rotate the scaled unit direction by +/-30 degrees without trig calls
+        scale = (10 + width) / length
+        ux, uy = dx * scale, dy * scale
+        return (
             x2, y2,
-            x2 - arrow_size * math.cos(angle - math.pi/6),
-            y2 - arrow_size * math.sin(angle - math.pi/6),
-            x2 - arrow_size * math.cos(angle + math.pi/6),
-            y2 - arrow_size * math.sin(angle + math.pi/6)
-        ]
-        
-        # Draw arrowhead
-        self.create_polygon(points, fill=color, outline=color)
+            x2 - (ux * _COS30 + uy * _SIN30),
+            y2 - (uy * _COS30 - ux * _SIN30),
+            x2 - (ux * _COS30 - uy * _SIN30),
+            y2 - (uy * _COS30 + ux * _SIN30)
+        )
 
     def get_annotated_image(self):
         """Get the image with all annotations rendered on it."""
-        # Create a copy of the original image to draw on
-        annotated_image = self.original_image.copy()
+        # Apply any recolor still waiting for the idle repaint
+        if self._dirty_after_id is not None:
+            self.after_cancel(self._dirty_after_id)
+            self._flush_dirty()
+        if self._redraw_pending:
+            # The canvas was hidden when the layer was last composited
+            self._sync_annotation_layer()
+        
+        if self._annot_buf is not None:
+            # Freehand strokes are already rendered in the annotation layer,
+            # beneath the other elements just as on screen
+            if self._base_rgba is None:
+                self._base_rgba = self.original_image.convert('RGBA')
+            annotated_image = Image.alpha_composite(self._base_rgba, self._annot_buf)
+            if self.original_image.mode != 'RGBA':
+                annotated_image = annotated_image.convert(self.original_image.mode)
+        else:
+            # Create a copy of the original image to draw on
+            annotated_image = self.original_image.copy()
         draw = ImageDraw.Draw(annotated_image)
         
         # Draw all elements on the image
@@ -401,27 +873,11 @@ class DrawingCanvas(tk.Canvas):
                 draw.line([element.x1, element.y1, element.x2, element.y2],
                          fill=element.color, width=element.width)
                 # Calculate arrow head
-                angle = math.atan2(element.y2 - element.y1, element.x2 - element.x1)
-                arrow_size = 10 + element.width
-                points = [
-                    element.x2,
-                    element.y2,
-                    int(element.x2 - arrow_size * math.cos(angle - math.pi/6)),
-                    int(element.y2 - arrow_size * math.sin(angle - math.pi/6)),
-                    int(element.x2 - arrow_size * math.cos(angle + math.pi/6)),
-                    int(element.y2 - arrow_size * math.sin(angle + math.pi/6))
-                ]
+                points = [int(coord) for coord in self._arrow_head_points(
+                    element.x1, element.y1, element.x2, element.y2, element.width)]
                 draw.polygon(points, fill=element.color)
-            elif element.tool_type == DrawingTool.FREEHAND:
-                if hasattr(element, 'points') and len(element.points) > 1:
-                    # Convert points to flat list for PIL
-                    points = []
-                    for point in element.points:
-                        points.extend(point)
-                    if len(points) >= 4:  # Need at least 2 points (4 coordinates)
-                        draw.line(points, fill=element.color, width=element.width)
             elif element.tool_type == DrawingTool.TEXT:
-                if hasattr(element, 'text') and element.text:
+                if element.text:
                     draw.text((element.x1, element.y1), element.text,
                              fill=element.color, font=None)
     
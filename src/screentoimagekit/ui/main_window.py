@@ -1,27 +1,140 @@
 """Main application window for ScreenToImageKit."""
 
 import os
-import time
+import pickle
+import queue
+import concurrent.futures
+from functools import partial
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import logging
 from PIL import Image, ImageTk
 from src.screentoimagekit.progress_tracker import ProgressTracker, WorkflowStage
 from src.screentoimagekit.config import ConfigManager
-from src.screentoimagekit.services.image_handler import ImageHandler
-import pyperclip
 import win32con
 import win32gui
-import win32api
-from src.screentoimagekit.ui.config_dialog import ConfigDialog
-from src.screentoimagekit.ui.preview_window import PreviewWindow
-from src.screentoimagekit.ui.selection_window import SelectionWindow
 
 logger = logging.getLogger(__name__)
 
+# Global Ctrl+W hotkey registration
+_HOTKEY_ID = 1
+_MOD_NOREPEAT = 0x4000  # Don't re-fire WM_HOTKEY while the keys are held
+_HWND_MESSAGE = -3  # Parent handle that makes a window message-only
+_HOTKEY_WINDOW_CLASS = "ScreenToImageKitHotkey"
+_hotkey_handlers = {}  # Message-only window handle -> MainWindow._on_hotkey
+_hotkey_class_registered = False
+
+# The main window is moved here, off every screen, while a capture is taken
+_OFFSCREEN_X = 20000
+_OFFSCREEN_GEOMETRY = f"+{_OFFSCREEN_X}+{_OFFSCREEN_X}"
+# update_idletasks only hands the move to the window manager; once it reports
+# the new position, a few compositor frames are allowed for the screen to be
+# repainted without the window before capturing
+_CAPTURE_SETTLE_MS = 50
+# Capture anyway if the window manager never reports the move
+_CAPTURE_TIMEOUT_MS = 500
+
+# Most worker results handled per Tk event before yielding to the event loop
+_UI_DRAIN_LIMIT = 16
+# How often the Tk thread checks for worker results while any are outstanding
+_UI_POLL_MS = 50
+
+# Button icons, as (name, path) pairs, shown at _ICON_SIZE
+_ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'icons')
+_ICON_PATHS = tuple((name, os.path.join(_ICONS_DIR, filename)) for name, filename in (
+    ('capture', 'capture.png'),
+    ('fullscreen', 'capture-full-screen.png'),
+    ('settings', 'settings.png'),
+    ('password', 'password.png'),
+    ('tray', 'tray.png'),
+))
+_ICON_SIZE = (24, 24)
+_ICON_CACHE_PATH = os.path.join(_ICONS_DIR, '.cache.pkl')
+
+# Resized icon pixels by icon name, kept for the life of the process
+_icon_data = None
+
+def _on_hotkey_message(hwnd, msg, wparam, lparam):
+    """Window procedure for WM_HOTKEY, shared by every hotkey window."""
+    handler = _hotkey_handlers.get(hwnd)
+    if handler is None:
+        return 0
+    return handler(hwnd, msg, wparam, lparam)
+
+
+def _register_hotkey_class():
+    """Register the message-only window class, once per process.
+
+    Returns:
+        int: Module handle the class was registered with
+    """
+    global _hotkey_class_registered
+    instance = win32gui.GetModuleHandle(None)
+    if not _hotkey_class_registered:
+        window_class = win32gui.WNDCLASS()
+        window_class.hInstance = instance
+        window_class.lpszClassName = _HOTKEY_WINDOW_CLASS
+        window_class.lpfnWndProc = {win32con.WM_HOTKEY: _on_hotkey_message}
+        win32gui.RegisterClass(window_class)
+        _hotkey_class_registered = True
+    return instance
+
+
+def _load_icon_data():
+    """Get the resized RGBA pixels of the button icons.
+
+    Decoding and resampling the PNGs is the slow part of loading icons, so
+    the result is pickled next to them and reused until an icon changes.
+
+    Returns:
+        dict: Icon name to (width, height, rgba_bytes); icons that failed
+            to load are missing
+    """
+    global _icon_data
+    if _icon_data is not None:
+        return _icon_data
+    
+    try:
+        key = tuple((name, os.stat(path).st_mtime_ns) for name, path in _ICON_PATHS)
+    except OSError:
+        key = None
+    
+    if key is not None:
+        try:
+            with open(_ICON_CACHE_PATH, 'rb') as cache_file:
+                cached = pickle.load(cache_file)
+            if cached.get('key') == key:
+                _icon_data = cached['icons']
+                return _icon_data
+        except Exception:
+            pass  # Missing or stale cache; rebuild it below
+    
+    icons = {}
+    for name, path in _ICON_PATHS:
+        try:
+            image = Image.open(path).convert('RGBA')
+            # Resize to appropriate button size
+            image = image.resize(_ICON_SIZE, Image.Resampling.LANCZOS)
+            icons[name] = (image.width, image.height, image.tobytes())
+        except Exception as e:
+            logger.error(f"Error loading icon {os.path.basename(path)}: {e}")
+    
+    if key is not None and len(icons) == len(_ICON_PATHS):
+        try:
+            with open(_ICON_CACHE_PATH, 'wb') as cache_file:
+                pickle.dump({'key': key, 'icons': icons}, cache_file, pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write icon cache: {e}")
+    _icon_data = icons
+    return icons
+
 class MainWindow:
     """Main application window."""
     
+    # (Tk interpreter, icon name -> PhotoImage) of the last loaded icons;
+    # Tk images belong to one interpreter, so a new Tk root reloads them
+    _icon_cache = None
+    
     def __init__(self, root, image_handler, imagekit_service):
         """Initialize the window."""
         self.root = root
@@ -44,40 +157,52 @@ class MainWindow:
         self.direct_upload_var = None
         self.use_gemini_var = None
         
-        # Progress tracking
+        # Progress tracking; status text is applied once per idle pass
+        self._pending_status = None
         self.progress_tracker = ProgressTracker(self._show_status)
         
+        # Worker threads for blocking calls that must stay off the Tk thread
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Results posted from worker threads, polled for on the Tk thread
+        self._ui_queue = queue.Queue()
+        self._ui_pending = 0  # Results expected from workers but not yet handled
+        self._ui_pump_scheduled = False
+        
         # Hotkey state
-        self.last_capture_time = 0
         self.is_capturing = False
+        self._hotkey_hwnd = None
+        self._credentials_loaded = False
+        self._saved_geometry = None  # Window geometry to restore after a capture
+        self._capture_next = None  # (callback, args) to run once the window is hidden
+        self._capture_bind_id = None
+        self._capture_timeout_id = None
         
         # Initialize
         self._setup_window()
         self._create_ui()
-        self._load_credentials()
-        self._setup_message_check()
+        self._register_hotkey()
+        # Decrypt and apply saved credentials once the event loop is running,
+        # so the result is picked up by the Tk-side pump
+        self.root.after_idle(self._load_credentials)
 
     def _load_icons(self):
-        """Load icons for buttons."""
-        icon_files = {
-            'capture': 'capture.png',
-            'fullscreen': 'capture-full-screen.png',
-            'settings': 'settings.png',
-            'password': 'password.png',
-            'tray': 'tray.png'
-        }
-        
-        icons_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'icons')
+        """Load icons for buttons, reusing those of an earlier window on the same root."""
+        cache = MainWindow._icon_cache
+        if cache is not None and cache[0] is self.root.tk:
+            self.icons.update(cache[1])
+            return
         
-        for name, filename in icon_files.items():
-            try:
-                image = Image.open(os.path.join(icons_dir, filename))
-                # Resize to appropriate button size
-                image = image.resize((24, 24), Image.Resampling.LANCZOS)
-                self.icons[name] = ImageTk.PhotoImage(image)
-            except Exception as e:
-                logger.error(f"Error loading icon {filename}: {e}")
+        icon_data = _load_icon_data()
+        for name, _ in _ICON_PATHS:
+            if name in icon_data:
+                width, height, raw = icon_data[name]
+                # frombytes is a plain copy; no decode or resample
+                self.icons[name] = ImageTk.PhotoImage(
+                    Image.frombytes('RGBA', (width, height), raw), master=self.root
+                )
+            else:
                 self.icons[name] = None
+        MainWindow._icon_cache = (self.root.tk, dict(self.icons))
 
     def _create_ui(self):
         """Create the user interface."""
@@ -204,45 +329,109 @@ class MainWindow:
         self.root.bind('<Control-w>', lambda e: self._quick_capture())
 
     def _load_credentials(self):
-        """Load ImageKit credentials."""
+        """Start loading ImageKit credentials on a worker thread.
+
+        Runs on the Tk thread; the result is delivered through _pump_ui_queue.
+        """
+        future = self._io_pool.submit(self._read_credentials)
+        future.add_done_callback(lambda f: self._post_to_ui(self._on_credentials_loaded, f))
+        self._expect_result()
+
+    def _read_credentials(self):
+        """Decrypt saved credentials and initialize ImageKit with them.
+
+        Runs on a worker thread, so it must not touch any widget.
+
+        Returns:
+            bool: True if ImageKit was configured from the saved credentials
+        """
+        private_key, public_key, url_endpoint = self.config_manager.load_credentials()
+        if all([private_key, public_key, url_endpoint]):
+            return self.imagekit_service.initialize(private_key, public_key, url_endpoint)
+        return False
+
+    def _on_credentials_loaded(self, future):
+        """Report the result of the background credential load."""
         try:
-            private_key, public_key, url_endpoint = self.config_manager.load_credentials()
-            if all([private_key, public_key, url_endpoint]):
-                if self.imagekit_service.initialize(private_key, public_key, url_endpoint):
-                    self.status_label.configure(
-                        text="ImageKit configured successfully!",
-                        foreground="green"
-                    )
-                    return True
+            if future.result():
+                self._show_status("ImageKit configured successfully!")
         except Exception as e:
             logger.error(f"Error loading credentials: {e}")
             self._show_status("Error loading credentials: " + str(e), True)
+        finally:
+            self._credentials_loaded = True
+
+    def _require_configured(self):
+        """Check that ImageKit is configured before starting a capture.
+
+        Returns:
+            bool: True if ImageKit is configured; otherwise False, after
+                showing why in the status label
+        """
+        if self.imagekit_service.is_configured:
+            return True
+        if not self._credentials_loaded:
+            self._show_status("Still loading credentials...")
+        else:
+            self._show_status("ImageKit is not configured. Please configure it first.", True)
         return False
 
-    def _setup_message_check(self):
-        """Setup Windows message checking."""
-        self.root.after(200, self.check_messages)
+    def _register_hotkey(self):
+        """Register Ctrl+W as a global hotkey.
 
-    def check_messages(self):
-        """Check for hotkey combinations."""
+        WM_HOTKEY is delivered to a hidden message-only window created on the
+        Tk thread, so Tk's own message loop dispatches it and no polling is
+        needed. If the hotkey is taken by another program, Ctrl+W only works
+        while this window has focus.
+        """
         try:
-            current_time = time.time()
-            # Check if enough time has passed since last capture (1 second cooldown)
-            if current_time - self.last_capture_time >= 1.0 and not self.is_capturing:
-                # Check if Ctrl+W is pressed
-                if win32api.GetAsyncKeyState(win32con.VK_CONTROL) & 0x8000 and \
-                   win32api.GetAsyncKeyState(ord('W')) & 0x8000:
-                    self.last_capture_time = current_time
-                    self._quick_capture()
+            instance = _register_hotkey_class()
+            hwnd = win32gui.CreateWindow(
+                _HOTKEY_WINDOW_CLASS, _HOTKEY_WINDOW_CLASS, 0, 0, 0, 0, 0,
+                _HWND_MESSAGE, 0, instance, None
+            )
         except Exception as e:
-            logger.error(f"Error checking messages: {e}")
-        finally:
-            # Schedule next check (reduced frequency)
-            self.root.after(200, self.check_messages)
+            logger.warning(f"Could not register global hotkey: {e}")
+            return
+        try:
+            win32gui.RegisterHotKey(
+                hwnd, _HOTKEY_ID, win32con.MOD_CONTROL | _MOD_NOREPEAT, ord('W')
+            )
+        except Exception as e:
+            logger.warning(f"Could not register global hotkey: {e}")
+            try:
+                win32gui.DestroyWindow(hwnd)
+            except Exception as e:
+                logger.error(f"Error destroying hotkey window: {e}")
+            return
+        _hotkey_handlers[hwnd] = self._on_hotkey
+        self._hotkey_hwnd = hwnd
+        logger.info("Registered global Ctrl+W hotkey")
+
+    def _on_hotkey(self, hwnd, msg, wparam, lparam):
+        """Handle WM_HOTKEY from the message-only window."""
+        if wparam == _HOTKEY_ID:
+            # Leave the window procedure before opening the selection window
+            self.root.after_idle(self._quick_capture)
+        return 0
+
+    def _unregister_hotkey(self):
+        """Release the global hotkey and its message-only window."""
+        if self._hotkey_hwnd is None:
+            return
+        hwnd, self._hotkey_hwnd = self._hotkey_hwnd, None
+        _hotkey_handlers.pop(hwnd, None)
+        try:
+            try:
+                win32gui.UnregisterHotKey(hwnd, _HOTKEY_ID)
+            finally:
+                win32gui.DestroyWindow(hwnd)
+        except Exception as e:
+            logger.error(f"Error unregistering hotkey: {e}")
 
     def _quick_capture(self):
         """Handle quick capture with Ctrl + W."""
-        if self.is_capturing:
+        if self.is_capturing or not self._require_configured():
             return
             
         logger.info("Quick capture triggered with Ctrl + W")
@@ -254,31 +443,52 @@ class MainWindow:
             def on_selection(coords):
                 self.area = coords
             
+            from src.screentoimagekit.ui.selection_window import SelectionWindow
             selection = SelectionWindow(self.root, on_selection)
             self.root.wait_window(selection.window)  # Wait for selection window to close
             
             if self.area:
-                # Capture the selected area
-                temp_path, screenshot = self.image_handler.capture_area(self.area)
-                if temp_path:
-                    # Upload to ImageKit
-                    try:
-                        url = self.imagekit_service.upload_file(temp_path)
-                        if url:
-                            # Show success message at bottom
-                            self._show_success("Screenshot uploaded and URL copied to clipboard!")
-                        else:
-                            self._show_success("Failed to upload screenshot to ImageKit")
-                    except ValueError as ve:
-                        self._show_status("ImageKit is not configured. Please configure it first.", True)
-                    except Exception as e:
-                        self._show_status(f"Failed to upload screenshot: {str(e)}", True)
+                # Grab and encode the selected area in memory on a worker
+                future = self._io_pool.submit(
+                    self._grab_screenshot, partial(self.image_handler.capture_area, self.area), False
+                )
+                future.add_done_callback(lambda f: self._post_to_ui(self._on_quick_captured, f))
+                self._expect_result()
+                self._show_status("Capturing screenshot...")
         except Exception as e:
             logger.error(f"Error during quick capture: {e}")
             self._show_status(f"Failed to capture screenshot: {str(e)}", True)
         finally:
             self.is_capturing = False
 
+    def _on_quick_captured(self, future):
+        """Queue the upload of a quick capture once it has been encoded."""
+        try:
+            _, screenshot, encoded = future.result()
+            if screenshot:
+                file_name, data = encoded
+                self.imagekit_service.enqueue_upload(data, file_name, self._on_quick_upload_done)
+                self._expect_result()
+                self._show_status("Uploading screenshot...")
+        except Exception as e:
+            logger.error(f"Error during quick capture: {e}")
+            self._show_status(f"Failed to capture screenshot: {str(e)}", True)
+
+    def _on_quick_upload_done(self, url, error):
+        """Handle a finished quick-capture upload (called on the upload thread)."""
+        self._post_to_ui(self._report_quick_upload, url, error)
+
+    def _report_quick_upload(self, url, error):
+        """Show the result of a quick-capture upload."""
+        if url:
+            # Show success message at bottom
+            self._show_status("Ready")
+            self._show_success("Screenshot uploaded and URL copied to clipboard!")
+        elif isinstance(error, ValueError):
+            self._show_status("ImageKit is not configured. Please configure it first.", True)
+        else:
+            self._show_status(f"Failed to upload screenshot: {str(error)}", True)
+
     def _handle_area_selection(self):
         """Handle area selection button click."""
         try:
@@ -286,6 +496,7 @@ class MainWindow:
             logger.info("Starting area selection")
             
             # Create selection window with callback
+            from src.screentoimagekit.ui.selection_window import SelectionWindow
             selection = SelectionWindow(self.root, self._on_area_selected)
             
         except Exception as e:
@@ -294,126 +505,343 @@ class MainWindow:
 
     def _on_area_selected(self, coords):
         """Handle area selection completion."""
+        if not coords or len(coords) != 4:
+            logger.warning("Invalid coordinates received")
+            return
+
+        # Move main window aside and capture once the screen has been redrawn
+        self._hide_for_capture(self._capture_area, coords)
+
+    def _capture_area(self, coords):
+        """Capture the selected area on a worker thread once the main window is hidden."""
+        logger.info(f"Capturing screenshot with coords: {coords}")
+        self._start_grab(partial(self.image_handler.capture_area, coords))
+
+    def _finish_capture(self, capture_path, screenshot, direct_upload, use_gemini, encoded=None):
+        """Upload or preview a capture once its file name is final.
+
+        Args:
+            capture_path: Saved screenshot file, or None if it was kept in memory
+            screenshot: The captured PIL image
+            direct_upload: Upload without showing the preview
+            use_gemini: Whether Gemini named the file
+            encoded: (file_name, png_data) of a capture kept in memory
+        """
+        # If direct upload is enabled, skip preview
+        if direct_upload:
+            if capture_path:
+                self._on_upload_confirmed(capture_path)
+            else:
+                self._upload_screenshot(encoded)
+        else:
+            # Show preview window
+            from src.screentoimagekit.ui.preview_window import PreviewWindow
+            PreviewWindow(
+                self.root,
+                screenshot,
+                partial(self._on_preview_upload, capture_path),
+                partial(self._on_preview_cancelled, capture_path),
+                direct_upload,
+                use_gemini
+            )
+
+    def _on_preview_upload(self, capture_path, upload_path):
+        """Upload the image saved by the preview window.
+
+        The annotated image replaces the capture file, so a name given by
+        Gemini is kept for the upload.
+
+        Args:
+            capture_path: File written at capture time, or None if the
+                screenshot was kept in memory
+            upload_path: File holding the image with its annotations
+        """
+        if capture_path and capture_path != upload_path:
+            try:
+                os.replace(upload_path, capture_path)
+                upload_path = capture_path
+            except OSError as e:
+                logger.error(f"Error replacing {capture_path}: {e}")
+                self.image_handler.cleanup_temp_file(capture_path)
+        self._on_upload_confirmed(upload_path)
+
+    def _describe_async(self, temp_path, on_done):
+        """Name a screenshot with Gemini on a worker thread.
+
+        Args:
+            temp_path: Path of the saved screenshot
+            on_done: Called on the Tk thread with the renamed path, or the
+                original path if no description was produced
+        """
+        self.progress_tracker.start_stage(WorkflowStage.ANALYSIS)
+        future = self._io_pool.submit(self.image_handler.get_image_description, temp_path)
+        future.add_done_callback(
+            lambda f: self._post_to_ui(self._on_described, f, temp_path, on_done)
+        )
+        self._expect_result()
+
+    def _on_described(self, future, temp_path, on_done):
+        """Rename a screenshot after its Gemini description arrives."""
         try:
-            if not coords or len(coords) != 4:
-                logger.warning("Invalid coordinates received")
-                return
+            description = future.result()
+            if description:
+                temp_path = self.image_handler.rename_with_description(temp_path, description)
+            on_done(temp_path)
+        except Exception as e:
+            logger.error(f"Error processing screenshot: {e}")
+            self._show_error(f"Error processing screenshot: {e}")
+            self.progress_tracker.reset()
+
+    def _handle_fullscreen(self):
+        """Handle full screen capture button click."""
+        if not self._require_configured():
+            return
 
-            # Hide main window during capture
-            self.root.withdraw()
-            self.root.update()
-            time.sleep(0.2)  # Give time for window to hide
+        self.progress_tracker.start_workflow()
+        logger.info("Capturing full screen")
+        
+        # Move window aside and capture once the screen has been redrawn
+        self._hide_for_capture(self._capture_fullscreen)
+
+    def _hide_for_capture(self, callback, *args):
+        """Move the main window off-screen, then run callback(*args).
+
+        Unlike withdraw/deiconify this is a plain window move, with no
+        minimize or restore animation to wait out. The callback runs
+        _CAPTURE_SETTLE_MS after the window manager reports the window at
+        its off-screen position, or after _CAPTURE_TIMEOUT_MS if it never
+        does.
+
+        Args:
+            callback: Takes the screenshot
+            *args: Arguments for callback
+        """
+        if self._saved_geometry is None:
+            self._saved_geometry = self.root.geometry()
+        self._capture_next = (callback, args)
+        self.root.geometry(_OFFSCREEN_GEOMETRY)
+        if not self.root.winfo_viewable():
+            # No move to wait for, but other windows such as the selection
+            # overlay may only just have been destroyed
+            self.root.after(_CAPTURE_SETTLE_MS, self._start_capture)
+            return
+        self._capture_bind_id = self.root.bind('<Configure>', self._on_hidden_configure, '+')
+        self._capture_timeout_id = self.root.after(_CAPTURE_TIMEOUT_MS, self._start_capture)
 
-            logger.info(f"Capturing screenshot with coords: {coords}")
-            
-            # Capture the screenshot
-            temp_path, screenshot = self.image_handler.capture_area(coords)
-            if not temp_path or not screenshot:
+    def _on_hidden_configure(self, event):
+        """Start the settle delay once the main window has moved off-screen."""
+        if event.widget is not self.root or self.root.winfo_rootx() < _OFFSCREEN_X:
+            return
+        self._stop_waiting_for_move()
+        self.root.after(_CAPTURE_SETTLE_MS, self._start_capture)
+
+    def _stop_waiting_for_move(self):
+        """Drop the <Configure> binding and timeout set by _hide_for_capture."""
+        if self._capture_bind_id is not None:
+            self.root.unbind('<Configure>', self._capture_bind_id)
+            self._capture_bind_id = None
+        if self._capture_timeout_id is not None:
+            self.root.after_cancel(self._capture_timeout_id)
+            self._capture_timeout_id = None
+
+    def _start_capture(self):
+        """Run the callback passed to _hide_for_capture, once."""
+        self._stop_waiting_for_move()
+        if self._capture_next is None:
+            return
+        callback, args = self._capture_next
+        self._capture_next = None
+        callback(*args)
+
+    def _restore_after_capture(self):
+        """Put the main window back where it was before the capture."""
+        if self._saved_geometry is not None:
+            self.root.geometry(self._saved_geometry)
+            self._saved_geometry = None
+        self.root.lift()
+
+    def _capture_fullscreen(self):
+        """Capture the full screen on a worker thread once the main window is hidden."""
+        self._start_grab(self.image_handler.capture_fullscreen)
+
+    def _start_grab(self, capture):
+        """Take a screenshot on a worker thread.
+
+        Grabbing, saving and encoding a large screen takes long enough to
+        stall the UI; the result is handed back to _on_screen_captured on
+        the Tk thread.
+
+        Args:
+            capture: ImageHandler capture method taking a save argument
+        """
+        try:
+            # Only Gemini and the preview need the capture on disk
+            use_gemini = self.use_gemini_var.get()
+            direct_upload = self.direct_upload_var.get()
+            future = self._io_pool.submit(
+                self._grab_screenshot, capture, use_gemini or not direct_upload
+            )
+            future.add_done_callback(lambda f: self._post_to_ui(
+                self._on_screen_captured, f, use_gemini, direct_upload))
+            self._expect_result()
+        except Exception as e:
+            logger.error(f"Error capturing screenshot: {e}")
+            self._show_error(f"Error capturing screenshot: {e}")
+            self.progress_tracker.reset()
+            self._restore_after_capture()
+
+    def _grab_screenshot(self, capture, save):
+        """Take a screenshot and encode it if it is uploaded from memory.
+
+        Runs on a worker thread, so it must not touch any widget.
+
+        Args:
+            capture: ImageHandler capture method taking a save argument
+            save: Whether to write the screenshot to a temporary file
+
+        Returns:
+            tuple: (temp_file_path, screenshot_image, encoded); encoded is
+                the (file_name, png_data) of encode_png when save is False,
+                otherwise None
+        """
+        temp_path, screenshot = capture(save=save)
+        encoded = None
+        if screenshot and not save:
+            encoded = self.image_handler.encode_png(screenshot)
+        return temp_path, screenshot, encoded
+
+    def _on_screen_captured(self, future, use_gemini, direct_upload):
+        """Continue a capture once the screenshot has been taken."""
+        try:
+            temp_path, screenshot, encoded = future.result()
+            if not screenshot:
                 raise Exception("Failed to capture screenshot")
 
+            # Restore main window state
+            self._restore_after_capture()
+
             # Get description if Gemini is enabled
-            renamed_path = temp_path
-            if self.use_gemini_var.get():
-                description = self.image_handler.get_image_description(temp_path)
-                if description:
-                    renamed_path = self.image_handler.rename_with_description(temp_path, description)
-            
-            # If direct upload is enabled, skip preview
-            if self.direct_upload_var.get():
-                self._on_upload_confirmed(renamed_path)
+            if use_gemini:
+                self._describe_async(temp_path, partial(
+                    self._finish_capture, screenshot=screenshot,
+                    direct_upload=direct_upload, use_gemini=use_gemini))
             else:
-                # Show preview window
-                PreviewWindow(
-                    self.root,
-                    screenshot,
-                    lambda path: self._on_upload_confirmed(renamed_path),
-                    lambda path: self._on_preview_cancelled(renamed_path),
-                    self.direct_upload_var.get(),
-                    self.use_gemini_var.get()
-                )
-            
-            # Restore main window state
-            self.root.deiconify()
-            self.root.lift()
-            
+                self._finish_capture(temp_path, screenshot, direct_upload, use_gemini, encoded)
+
         except Exception as e:
             logger.error(f"Error capturing screenshot: {e}")
             self._show_error(f"Error capturing screenshot: {e}")
             self.progress_tracker.reset()
-            self.root.deiconify()
+            self._restore_after_capture()
 
-    def _handle_fullscreen(self):
-        """Handle full screen capture button click."""
-        if not self.imagekit_service.is_configured:
-            self._show_status("Please configure ImageKit credentials.", True)
-            return
+    def _on_upload_confirmed(self, temp_path):
+        """Handle upload confirmation from preview window.
 
+        The upload runs on the ImageKit service's background loop; the temp
+        file is removed once it has finished.
+        """
         try:
-            self.progress_tracker.start_workflow()
-            logger.info("Capturing full screen")
-            
-            # Hide window before capture
-            self.root.withdraw()
-            self.root.update()
-            time.sleep(0.5)  # Give time for window to hide
+            if not self.imagekit_service.is_configured:
+                raise ValueError("ImageKit is not configured")
             
-            # Capture full screen
-            temp_path, screenshot = self.image_handler.capture_fullscreen()
-            if temp_path and screenshot:
-                # Get description if Gemini is enabled
-                if self.use_gemini_var.get():
-                    description = self.image_handler.get_image_description(temp_path)
-                    if description:
-                        temp_path = self.image_handler.rename_with_description(temp_path, description)
-
-                # If direct upload is enabled, skip preview
-                if self.direct_upload_var.get():
-                    self._on_upload_confirmed(temp_path)
-                else:
-                    # Show preview
-                    PreviewWindow(
-                        self.root,
-                        screenshot,
-                        self._on_upload_confirmed,
-                        self._on_preview_cancelled,
-                        self.direct_upload_var.get(),
-                        self.use_gemini_var.get()
-                    )
-                
-                # Restore window
-                self.root.deiconify()
-                self.root.lift()
-            else:
-                raise Exception("Failed to capture full screen")
-                
+            self.imagekit_service.enqueue_file_upload(
+                temp_path, partial(self._on_upload_done, temp_path=temp_path)
+            )
+            self._expect_result()
+            self.progress_tracker.start_stage(WorkflowStage.UPLOAD)
         except Exception as e:
-            self.progress_tracker.update_progress(str(e), True)
-            logger.error(f"Error capturing full screen: {e}")
-            self.root.deiconify()
+            self._show_error(f"Error uploading screenshot: {e}")
+            logger.error(f"Error uploading screenshot: {e}")
+            self.image_handler.cleanup_temp_file(temp_path)
 
-    def _on_upload_confirmed(self, temp_path):
-        """Handle upload confirmation from preview window."""
+    def _upload_screenshot(self, encoded):
+        """Upload a captured screenshot from memory, without a temp file.
+
+        Args:
+            encoded: (file_name, png_data) from ImageHandler.encode_png
+        """
         try:
             if not self.imagekit_service.is_configured:
                 raise ValueError("ImageKit is not configured")
             
-            url = self.imagekit_service.upload_file(temp_path)
+            file_name, data = encoded
+            self.imagekit_service.enqueue_upload(data, file_name, self._on_upload_done)
+            self._expect_result()
+            self.progress_tracker.start_stage(WorkflowStage.UPLOAD)
+        except Exception as e:
+            self._show_error(f"Error uploading screenshot: {e}")
+            logger.error(f"Error uploading screenshot: {e}")
+
+    def _on_upload_done(self, url, error, temp_path=None):
+        """Handle a finished workflow upload (called on the upload thread)."""
+        self._post_to_ui(self._report_upload, url, error, temp_path)
+
+    def _post_to_ui(self, callback, *args):
+        """Queue callback(*args) to run on the Tk thread; safe to call from any thread.
+
+        Only the queue is touched here: Tk calls from worker threads can fail
+        outright, so the Tk thread picks results up in _pump_ui_queue.
+        """
+        self._ui_queue.put((callback, args))
+
+    def _expect_result(self):
+        """Note that a worker will post one result; call on the Tk thread.
+
+        The queue is only polled while results are outstanding, so an idle
+        window does not wake up.
+        """
+        self._ui_pending += 1
+        if not self._ui_pump_scheduled:
+            self._ui_pump_scheduled = True
+            self.root.after(_UI_POLL_MS, self._pump_ui_queue)
+
+    def _pump_ui_queue(self):
+        """Run the callbacks posted by worker threads."""
+        self._ui_pump_scheduled = False
+        for _ in range(_UI_DRAIN_LIMIT):
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._ui_pending = max(self._ui_pending - 1, 0)
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Error handling background result: {e}")
+        if self._ui_pump_scheduled:
+            # A callback started more work and already rescheduled the pump
+            return
+        if not self._ui_queue.empty():
+            # More results are waiting; let the event loop run before the rest
+            self._ui_pump_scheduled = True
+            self.root.after(0, self._pump_ui_queue)
+        elif self._ui_pending:
+            self._ui_pump_scheduled = True
+            self.root.after(_UI_POLL_MS, self._pump_ui_queue)
+
+    def _report_upload(self, url, error, temp_path=None):
+        """Show the result of a workflow upload and remove its temp file."""
+        try:
             if url:
-                pyperclip.copy(url)
                 self._show_success("Screenshot uploaded and URL copied to clipboard!")
                 self.progress_tracker.complete()
             else:
-                raise Exception("Failed to get URL from ImageKit")
-                
-        except Exception as e:
-            self._show_error(f"Error uploading screenshot: {e}")
-            logger.error(f"Error uploading screenshot: {e}")
+                self._show_error(f"Error uploading screenshot: {error}")
+                self.progress_tracker.reset()
         finally:
-            self.image_handler.cleanup_temp_file(temp_path)
-
-    def _on_preview_cancelled(self, temp_path):
-        """Handle preview cancellation."""
-        self.image_handler.cleanup_temp_file(temp_path)
+            if temp_path:
+                self.image_handler.cleanup_temp_file(temp_path)
+
+    def _on_preview_cancelled(self, capture_path, preview_path):
+        """Handle preview cancellation.
+
+        Args:
+            capture_path: File written at capture time, or None if the
+                screenshot was kept in memory
+            preview_path: Path reported by the preview window; unused, since
+                the preview is opened from the in-memory image
+        """
+        self.image_handler.cleanup_temp_file(capture_path)
         self.progress_tracker.reset()
 
     def _handle_cancel(self, temp_path):
@@ -422,6 +850,8 @@ class MainWindow:
 
     def _show_config_dialog(self):
         """Handle configuration button click."""
+        # Imported on first use; most sessions never open the dialog
+        from src.screentoimagekit.ui.config_dialog import ConfigDialog
         dialog = ConfigDialog(self.root)
         if dialog.result:
             try:
@@ -465,6 +895,8 @@ class MainWindow:
             # Clean up temporary files
             if hasattr(self, 'image_handler'):
                 self.image_handler.cleanup()
+            self._unregister_hotkey()
+            self._io_pool.shutdown(wait=False)
             
             # Destroy the window and exit
             self.root.quit()
@@ -473,22 +905,28 @@ class MainWindow:
             logger.error(f"Error during exit: {e}")
 
     def _show_status(self, message, is_error=False):
-        """Show status message with color."""
-        if is_error:
-            self.status_label.configure(foreground="red", text=message)
-        else:
-            self.status_label.configure(foreground="green", text=message)
-        self.root.update()
+        """Show status message with color.
+
+        The label is updated on the main loop's next idle pass; when several
+        messages arrive before then, only the latest is shown.
+        """
+        if self._pending_status is None:
+            self.root.after_idle(self._flush_status)
+        self._pending_status = (message, is_error)
+
+    def _flush_status(self):
+        """Apply the latest status message to the status label."""
+        message, is_error = self._pending_status
+        self._pending_status = None
+        self.status_label.configure(foreground="red" if is_error else "green", text=message)
 
     def _show_success(self, message):
         """Show success message in green."""
         self.success_label.configure(text=message, foreground="green")
-        self.root.update()
 
     def _show_error(self, message):
         """Show error message in red."""
         self.success_label.configure(text=message, foreground="red")
-        self.root.update()
 
     def run(self):
         """Start the application main loop."""
@@ -511,41 +949,52 @@ class MainWindow:
 
     def close(self):
         """Close the application window."""
+        self._unregister_hotkey()
+        self._io_pool.shutdown(wait=False)
         self.root.quit()
 
+# Tooltip window shared by every ToolTip, created on first hover
+_TOOLTIP = None
+_TOOLTIP_LABEL = None
+
+def _get_tooltip(widget):
+    """Get the shared tooltip window, creating it withdrawn if needed."""
+    global _TOOLTIP, _TOOLTIP_LABEL
+    if _TOOLTIP is None or not _TOOLTIP.winfo_exists():
+        _TOOLTIP = tk.Toplevel(widget.winfo_toplevel())
+        _TOOLTIP.withdraw()
+        _TOOLTIP.wm_overrideredirect(True)
+        _TOOLTIP_LABEL = ttk.Label(
+            _TOOLTIP,
+            background="#ffffe0",
+            relief="solid",
+            borderwidth=1
+        )
+        _TOOLTIP_LABEL.pack()
+    return _TOOLTIP
+
 class ToolTip:
     """Create a tooltip for a given widget."""
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip = None
         self.widget.bind('<Enter>', self.show)
         self.widget.bind('<Leave>', self.hide)
 
     def show(self, event=None):
         """Display the tooltip."""
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
-
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
+        x = self.widget.winfo_rootx() + 25
+        y = self.widget.winfo_rooty() + 20
 
-        label = ttk.Label(
-            self.tooltip,
-            text=self.text,
-            background="#ffffe0",
-            relief="solid",
-            borderwidth=1
-        )
-        label.pack()
+        tooltip = _get_tooltip(self.widget)
+        _TOOLTIP_LABEL.configure(text=self.text)
+        tooltip.wm_geometry(f"+{x}+{y}")
+        tooltip.deiconify()
 
     def hide(self, event=None):
         """Hide the tooltip."""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if _TOOLTIP is not None and _TOOLTIP.winfo_exists():
+            _TOOLTIP.withdraw()
 
 def _create_tooltip(widget, text):
     """Create a tooltip for a widget."""
@@ -20,7 +20,8 @@ class PreviewWindow(tk.Toplevel):
             parent: Parent window
             image_or_path: PIL Image object or path to image
             on_upload: Callback for upload action
-            on_cancel: Callback for cancel action
+            on_cancel: Callback for cancel action, called with the image path
+                (None if the preview was opened from an image)
             direct_upload: Whether to upload immediately
             use_gemini: Whether to use Gemini AI for analysis
         """
@@ -109,7 +110,7 @@ class PreviewWindow(tk.Toplevel):
                         self.on_upload(self.temp_path)
                     else:
                         # Create a new temp file if we don't have one
-                        temp_path = os.path.join(os.getenv('TEMP'), 'screentoimagekit', f"s{os.urandom(4).hex()}.png")
+                        temp_path = os.path.join(os.getenv('TEMP'), 'screentoimagekit', f"s_{os.urandom(4).hex()}.png")
                         os.makedirs(os.path.dirname(temp_path), exist_ok=True)
                         annotated_image.save(temp_path)
                         self.on_upload(temp_path)
@@ -121,7 +122,7 @@ class PreviewWindow(tk.Toplevel):
     def _on_close(self):
         """Handle window close."""
         try:
-            if self.on_cancel and self.temp_path:
+            if self.on_cancel:
                 self.on_cancel(self.temp_path)
             self.destroy()
         except Exception as e:
@@ -0,0 +1,90 @@
+"""Geometry helpers for ScreenToImageKit annotations."""
+
+from typing import List, Sequence
+
+def simplify_polyline(coords: Sequence[int], epsilon: float = 1.5) -> List[int]:
+    """Simplify a polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Uses an explicit stack instead of recursion so long strokes cannot hit
+    the recursion limit.
+
+    Args:
+        coords (Sequence[int]): Flat polyline coordinates [x0, y0, x1, y1, ...]
+            in drawing order
+        epsilon (float): Maximum distance in pixels a dropped point may lie
+            from the simplified line
+
+    Returns:
+        List[int]: Flat coordinates of the kept vertices, always including
+            both endpoints
+    """
+    count = len(coords) // 2
+    if count < 3:
+        return list(coords)
+
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    eps_sq = epsilon * epsilon
+    stack = [(0, count - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        ax, ay = coords[2 * start], coords[2 * start + 1]
+        bx, by = coords[2 * end], coords[2 * end + 1]
+        dx, dy = bx - ax, by - ay
+        seg_len_sq = dx * dx + dy * dy
+
+        max_dist_sq = 0.0
+        index = start
+        for i in range(start + 1, end):
+            px, py = coords[2 * i], coords[2 * i + 1]
+            if seg_len_sq:
+                # Squared perpendicular distance to the line through a and b
+                cross = dx * (py - ay) - dy * (px - ax)
+                dist_sq = cross * cross / seg_len_sq
+            else:
+                dist_sq = (px - ax) ** 2 + (py - ay) ** 2
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                index = i
+
+        if max_dist_sq > eps_sq:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    simplified = []
+    for i, kept in enumerate(keep):
+        if kept:
+            simplified += (coords[2 * i], coords[2 * i + 1])
+    return simplified
+
+def point_segment_distance_sq(px: float, py: float, ax: float, ay: float,
+                              bx: float, by: float) -> float:
+    """Get the squared distance from a point to a line segment.
+
+    Callers compare against a squared threshold, so no square root is taken.
+
+    Args:
+        px (float): X of the point
+        py (float): Y of the point
+        ax (float): X of the segment start
+        ay (float): Y of the segment start
+        bx (float): X of the segment end
+        by (float): Y of the segment end
+
+    Returns:
+        float: Squared distance in pixels
+    """
+    dx, dy = bx - ax, by - ay
+    len_sq = dx * dx + dy * dy
+    if not len_sq:
+        return (px - ax) ** 2 + (py - ay) ** 2
+    # Project onto the segment and clamp to its endpoints
+    t = ((px - ax) * dx + (py - ay) * dy) / len_sq
+    if t <= 0:
+        return (px - ax) ** 2 + (py - ay) ** 2
+    if t >= 1:
+        return (px - bx) ** 2 + (py - by) ** 2
+    cross = dx * (py - ay) - dy * (px - ax)
+    return cross * cross / len_sq
@@ -43,6 +43,7 @@ class ImageHandler:
                     with self._processing_lock:
                         if os.path.exists(temp_path):
                             os.rename(temp_path, new_path)
+                            self.temp_file_service.record_rename(temp_path, new_path)
                             if callback:
                                 callback(new_path)
                     return
@@ -70,6 +71,7 @@ class ImageHandler:
                         with self._processing_lock:
                             if os.path.exists(temp_path):  # Check if original file still exists
                                 os.rename(temp_path, new_path)
+                                self.temp_file_service.record_rename(temp_path, new_path)
                                 logger.info(f"File renamed with AI description: {new_path}")
                                 if callback:
                                     callback(new_path)
@@ -84,6 +86,7 @@ class ImageHandler:
                     with self._processing_lock:
                         if os.path.exists(temp_path):
                             os.rename(temp_path, new_path)
+                            self.temp_file_service.record_rename(temp_path, new_path)
                             logger.info("Using default naming strategy with timestamp")
                             if callback:
                                 callback(new_path)
@@ -103,6 +106,7 @@ class ImageHandler:
                     with self._processing_lock:
                         if os.path.exists(temp_path):
                             os.rename(temp_path, new_path)
+                            self.temp_file_service.record_rename(temp_path, new_path)
                             if callback:
                                 callback(new_path)
                 except Exception as rename_error:
@@ -248,6 +252,7 @@ class ImageHandler:
                         with self._processing_lock:
                             if os.path.exists(temp_path):
                                 os.rename(temp_path, new_path)
+                                self.temp_file_service.record_rename(temp_path, new_path)
                                 logger.info(f"File renamed with AI description: {new_path}")
                                 final_path = new_path  # Update final path
                 finally:
@@ -263,6 +268,7 @@ class ImageHandler:
                 with self._processing_lock:
                     if os.path.exists(temp_path):
                         os.rename(temp_path, new_path)
+                        self.temp_file_service.record_rename(temp_path, new_path)
                         logger.info(f"File renamed with default name: {new_path}")
                         final_path = new_path  # Update final path
 
@@ -0,0 +1,30 @@
+"""Filename sanitizing helpers for ScreenToImageKit."""
+
+import re
+from typing import Optional
+
+# Byte translation table that lowercases ASCII letters and maps every other
+# character outside [a-z0-9_] to an underscore in a single pass.
+_FILENAME_CHAR_TABLE = bytes(
+    ord(chr(b).lower()) if chr(b).isascii() and (chr(b).isalnum() or chr(b) == '_') else ord('_')
+    for b in range(256)
+)
+_UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+
+def sanitize_filename(text: str, max_len: Optional[int] = None) -> str:
+    """Clean text for use as part of a filename.
+
+    Args:
+        text (str): Text to clean, e.g. an image description
+        max_len (int, optional): Maximum length of the result
+
+    Returns:
+        str: Lowercase text containing only [a-z0-9_], with runs of
+            underscores collapsed and no leading/trailing underscores
+    """
+    # Non-ASCII characters become '?' and are then mapped to '_'
+    clean = text.encode('ascii', 'replace').translate(_FILENAME_CHAR_TABLE).decode('ascii')
+    clean = _UNDERSCORE_RUN_RE.sub('_', clean).strip('_')
+    if max_len is not None:
+        clean = clean[:max_len].rstrip('_')
+    return clean